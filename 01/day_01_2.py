@@ -1,20 +1,104 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, pairwise, repeat
+import heapq
+import math
+import mmap
+import os
+import re
+import stat
+import sys
 
-def main():
-    elves_calories = read_elves_calories()
+BLOCK_SIZE = 1 << 24
+BLANK_LINE = re.compile(rb'\n\r?\n')
 
-    total_calories = [sum(elf_calories) for elf_calories in elves_calories]
-    total_calories.sort(reverse=True)
-    top_three_sum = sum(total_calories[:3])
+# Pass a count after the input path to sum a different number of elves, and
+# a number of processes after that to change how many read the file at
+# once, e.g. python 01/day_01_2.py 01/input.txt 5 4
+def main(input_path: str = '01/input.txt', k: int | str = 3, jobs: int | str | None = None):
+    k = int(k)
+    jobs = int(jobs) if jobs else os.cpu_count()
 
-    print('Top three calories:', top_three_sum)
+    # Each range keeps a heap of its k largest totals rather than sorting
+    # them all, and those are merged down to the overall k largest
+    top_calories = get_top_totals(input_path, k, jobs)
+    top_sum = sum(top_calories)
 
+    if k == 3:
+        print('Top three calories:', top_sum)
+    else:
+        print(f'Top {k} calories:', top_sum)
 
-def read_elves_calories():
-    with open('01/input.txt', encoding='utf-8') as file:
-        data = file.read()
 
-    return [[int(l) for l in elf.split('\n')] for elf in data.split('\n\n')]
+def get_top_totals(input_path: str, k: int, jobs: int):
+    with open(input_path, 'rb') as file:
+        # Pipes can't be mapped or split between processes, so read them line by line
+        if not stat.S_ISREG(os.fstat(file.fileno()).st_mode):
+            return heapq.nlargest(k, read_stream_totals(file))
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # Small files aren't worth starting processes for
+            range_count = min(jobs, math.ceil(len(data) / BLOCK_SIZE))
+            bounds = get_elf_boundaries(data, 0, len(data), range_count)
+
+    if len(bounds) <= 2:
+        return top_totals_in_range(input_path, bounds[0], bounds[-1], k)
+
+    with ProcessPoolExecutor(jobs) as executor:
+        partial_tops = executor.map(top_totals_in_range, repeat(input_path), bounds[:-1], bounds[1:], repeat(k))
+        return heapq.nlargest(k, chain.from_iterable(partial_tops))
+
+
+def top_totals_in_range(input_path: str, start: int, end: int, k: int):
+    with open(input_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return heapq.nlargest(k, read_elf_totals(data, start, end))
+
+
+def read_elf_totals(data: mmap.mmap, start: int, end: int):
+    # Read a block at a time so only one block is held in memory at once
+    bounds = get_elf_boundaries(data, start, end, math.ceil((end - start) / BLOCK_SIZE))
+
+    for block_start, block_end in pairwise(bounds):
+        block = data[block_start:block_end]
+
+        # Windows line endings would hide the blank lines between elves
+        if b'\r' in block:
+            block = block.replace(b'\r\n', b'\n')
+
+        for elf in block.split(b'\n\n'):
+            if elf.strip():
+                yield sum(map(int, elf.split()))
+
+
+def read_stream_totals(file):
+    # Yield each elf's total as the stream is read so only one is held at once
+    total = 0
+
+    for line in file:
+        if line.strip():
+            total += int(line)
+        else:
+            yield total
+            total = 0
+
+    yield total
+
+
+def get_elf_boundaries(data: mmap.mmap, start: int, end: int, count: int):
+    # Cut start to end into up to count ranges, moving each cut to just
+    # after the next blank line so every elf falls in a single range
+    bounds = [start]
+
+    for i in range(1, count):
+        blank_line = BLANK_LINE.search(data, max(bounds[-1], start + (end - start) * i // count), end)
+
+        if not blank_line:
+            break
+
+        bounds.append(blank_line.end())
+
+    bounds.append(end)
+    return bounds
 
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
@@ -1,6 +1,7 @@
 
 from enum import Enum
 from typing import Tuple
+import sys
 
 
 class Move(Enum):
@@ -16,16 +17,30 @@ class Outcome(Enum):
     WIN = 6
 
 
-def main():
-    rounds = read_rounds()
+BLOCK_SIZE = 1 << 24
+
+def main(input_path: str = '02/input.txt'):
+    round_scores = get_round_scores()
     score = 0
 
-    for rnd in rounds:
-        outcome = get_round_outcome(rnd)
-        score += rnd[1].value + outcome.value
+    # Count how often each of the nine possible rounds is played rather than
+    # scoring every line
+    for block in read_blocks(input_path):
+        for round_bytes, round_score in round_scores.items():
+            score += block.count(round_bytes) * round_score
 
     print('Total score:', score)
 
+def get_round_scores():
+    scores: dict[bytes, int] = {}
+
+    for move1 in 'ABC':
+        for move2 in 'XYZ':
+            rnd = (char_to_move(move1), char_to_move(move2))
+            scores[f'{move1} {move2}'.encode('ascii')] = rnd[1].value + get_round_outcome(rnd).value
+
+    return scores
+
 def get_round_outcome(rnd: Round):
     move1, move2 = rnd
 
@@ -43,9 +58,11 @@ def get_round_outcome(rnd: Round):
 
     return Outcome.LOSE
 
-def read_rounds() -> list[Round]:
-    with open('02/input.txt', encoding='utf-8') as file:
-        return [(char_to_move(line[0]), char_to_move(line[2])) for line in file]
+def read_blocks(input_path: str):
+    with open(input_path, 'rb') as file:
+        while block := file.read(BLOCK_SIZE):
+            # Finish the round the block was cut in
+            yield block + file.readline()
 
 def char_to_move(char):
     if char in 'AX':
@@ -60,4 +77,4 @@ def char_to_move(char):
 
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
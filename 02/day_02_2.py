@@ -1,6 +1,7 @@
 
 from enum import Enum
 from typing import NamedTuple
+import sys
 
 
 class Move(Enum):
@@ -17,16 +18,30 @@ class Round(NamedTuple):
     move: Move
     outcome: Outcome
 
-def main():
-    rounds = read_rounds()
+BLOCK_SIZE = 1 << 24
+
+def main(input_path: str = '02/input.txt'):
+    round_scores = get_round_scores()
     score = 0
 
-    for rnd in rounds:
-        move = get_round_move(rnd)
-        score += move.value + 1 + rnd.outcome.value
+    # Count how often each of the nine possible rounds is played rather than
+    # scoring every line
+    for block in read_blocks(input_path):
+        for round_bytes, round_score in round_scores.items():
+            score += block.count(round_bytes) * round_score
 
     print('Total score:', score)
 
+def get_round_scores():
+    scores: dict[bytes, int] = {}
+
+    for move in 'ABC':
+        for outcome in 'XYZ':
+            rnd = Round(char_to_move(move), char_to_outcome(outcome))
+            scores[f'{move} {outcome}'.encode('ascii')] = get_round_move(rnd).value + 1 + rnd.outcome.value
+
+    return scores
+
 def get_round_move(rnd: Round):
     if rnd.outcome == Outcome.DRAW:
         return rnd.move
@@ -36,9 +51,11 @@ def get_round_move(rnd: Round):
 
     return Move((rnd.move.value-1)%3)
 
-def read_rounds() -> list[Round]:
-    with open('02/input.txt', encoding='utf-8') as file:
-        return [Round(char_to_move(line[0]), char_to_outcome(line[2])) for line in file]
+def read_blocks(input_path: str):
+    with open(input_path, 'rb') as file:
+        while block := file.read(BLOCK_SIZE):
+            # Finish the round the block was cut in
+            yield block + file.readline()
 
 def char_to_move(char: str):
     if char == 'A':
@@ -61,4 +78,4 @@ def char_to_outcome(char: str):
     raise Exception(f'Invalid outcome: {char}')
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
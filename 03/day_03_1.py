@@ -1,9 +1,17 @@
+import string
+import sys
 
+# Bit n of a rucksack mask is set when it holds the item with priority n
+ITEM_BITS = [0] * 256
 
-Rucksack = tuple[str, str]
+for priority, char in enumerate(string.ascii_lowercase + string.ascii_uppercase, start=1):
+    ITEM_BITS[ord(char)] = 1 << priority
 
-def main():
-    rucksacks = read_rucksacks()
+
+Rucksack = tuple[bytes, bytes]
+
+def main(input_path: str = '03/input.txt'):
+    rucksacks = read_rucksacks(input_path)
 
     total = 0
 
@@ -15,24 +23,22 @@ def main():
 
 
 def find_shared_item(rucksack: Rucksack):
-    first = set(rucksack[0])
-    second = set(rucksack[1])
-    return first.intersection(second).pop()
+    # Intersecting a set is quicker than building a mask for each compartment
+    shared = set(rucksack[0]).intersection(rucksack[1])
+    return sum(map(ITEM_BITS.__getitem__, shared))
 
-def read_rucksacks():
-    with open('03/input.txt', encoding='ascii') as file:
-        return [parse_rucksack(line.strip()) for line in file]
+def read_rucksacks(input_path: str):
+    with open(input_path, 'rb') as file:
+        return [parse_rucksack(line) for line in file.read().split()]
 
-def parse_rucksack(line: str) -> Rucksack:
+def parse_rucksack(line: bytes) -> Rucksack:
     count = len(line) // 2
-    return (line[:count],line[count:])
+    return (line[:count], line[count:])
 
-def get_priority(item: str):
-    if item >= 'a' and item <= 'z':
-        return ord(item) - ord('a') + 1
-    if item >= 'A' and item <= 'Z':
-        return ord(item) - ord('A') + 27
-    raise Exception(f'Invalid item: {item}')
+def get_priority(item: int):
+    if item and not item & (item - 1):
+        return item.bit_length() - 1
+    raise Exception(f'Invalid item mask: {item:#x}')
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
@@ -1,7 +1,17 @@
 from functools import reduce
+from operator import and_, or_
+import string
+import sys
 
-def main():
-    rucksacks = read_rucksack_items()
+# Bit n of a rucksack mask is set when it holds the item with priority n
+ITEM_BITS = [0] * 256
+
+for priority, char in enumerate(string.ascii_lowercase + string.ascii_uppercase, start=1):
+    ITEM_BITS[ord(char)] = 1 << priority
+
+
+def main(input_path: str = '03/input.txt'):
+    rucksacks = read_rucksack_items(input_path)
 
     total = 0
 
@@ -15,19 +25,20 @@ def chunk(lst):
     for i in range(0, len(lst), 3):
         yield lst[i:i + 3]
 
-def find_shared_item(group: list[set[str]]):
-    return reduce(lambda acc, rucksack: acc.intersection(rucksack), group).pop()
+def find_shared_item(group: list[int]):
+    return reduce(and_, group)
+
+def read_rucksack_items(input_path: str):
+    with open(input_path, 'rb') as file:
+        return [get_item_mask(line) for line in file.read().split()]
 
-def read_rucksack_items():
-    with open('03/input.txt', encoding='ascii') as file:
-        return [set(line.strip()) for line in file]
+def get_item_mask(items: bytes):
+    return reduce(or_, map(ITEM_BITS.__getitem__, items), 0)
 
-def get_priority(item: str):
-    if item >= 'a' and item <= 'z':
-        return ord(item) - ord('a') + 1
-    if item >= 'A' and item <= 'Z':
-        return ord(item) - ord('A') + 27
-    raise Exception(f'Invalid item: {item}')
+def get_priority(item: int):
+    if item and not item & (item - 1):
+        return item.bit_length() - 1
+    raise Exception(f'Invalid item mask: {item:#x}')
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
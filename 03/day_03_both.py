@@ -0,0 +1,121 @@
+from functools import reduce
+from operator import and_, or_
+import string
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bit n of a rucksack mask is set when it holds the item with priority n
+ITEM_BITS = [0] * 256
+
+for priority, char in enumerate(string.ascii_lowercase + string.ascii_uppercase, start=1):
+    ITEM_BITS[ord(char)] = 1 << priority
+
+# Whether each byte is one that bytes.split() separates on
+IS_WHITESPACE = [byte in b' \t\n\r\x0b\x0c' for byte in range(256)]
+
+
+# Solves both parts from one read of the input. Pass 'numpy' after the
+# input path to do the work in array operations, e.g.
+# python 03/day_03_both.py 03/input.txt numpy
+def main(input_path: str = '03/input.txt', backend: str = 'python'):
+    with open(input_path, 'rb') as file:
+        data = file.read()
+
+    if backend == 'numpy':
+        if np is None:
+            raise Exception('The numpy backend needs numpy installed')
+
+        compartment_total, group_total = get_totals_numpy(data)
+    elif backend == 'python':
+        compartment_total, group_total = get_totals(data)
+    else:
+        raise Exception(f'Invalid backend: {backend}')
+
+    print('Sum of compartment priorities:', compartment_total)
+    print('Sum of group priorities:', group_total)
+
+
+def get_totals(data: bytes):
+    compartment_total = 0
+    group_total = 0
+    group: list[int] = []
+
+    for line in data.split():
+        count = len(line) // 2
+
+        # Intersecting a set is quicker than building a mask for each compartment
+        shared = set(line[:count]).intersection(line[count:])
+        compartment_total += get_priority(sum(map(ITEM_BITS.__getitem__, shared)))
+
+        group.append(reduce(or_, map(ITEM_BITS.__getitem__, line), 0))
+
+        if len(group) == 3:
+            group_total += get_priority(reduce(and_, group))
+            group.clear()
+
+    if group:
+        raise Exception(f'Incomplete group of {len(group)} rucksacks')
+
+    return compartment_total, group_total
+
+
+def get_totals_numpy(data: bytes):
+    items = np.frombuffer(data, dtype=np.uint8)
+    bits = np.array(ITEM_BITS, dtype=np.uint64)[items]
+
+    # Rucksacks are the runs between whitespace, as with bytes.split(), so
+    # blank lines and Windows line endings are skipped the same way
+    is_item = np.ones(len(items) + 2, dtype=np.int8)
+    is_item[[0, -1]] = 0
+    is_item[1:-1][np.array(IS_WHITESPACE)[items]] = 0
+    edges = np.diff(is_item)
+
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    middles = starts + (ends - starts) // 2
+
+    if len(starts) % 3:
+        raise Exception(f'Incomplete group of {len(starts) % 3} rucksacks')
+
+    if starts.size == 0:
+        return 0, 0
+
+    # OR together the bits of each half line, whitespace having no bits set
+    bounds = np.empty(len(starts) * 2, dtype=np.intp)
+    bounds[0::2] = starts
+    bounds[1::2] = middles
+    halves = np.bitwise_or.reduceat(bits, bounds)
+
+    first = halves[0::2]
+    second = halves[1::2]
+
+    # reduceat gives the item at an empty range's start rather than 0, so
+    # clear the empty first half of a one item rucksack
+    first[middles == starts] = 0
+
+    shared = first & second
+    groups = np.bitwise_and.reduce((first | second).reshape(-1, 3), axis=1)
+
+    return get_priorities_numpy(shared).sum().item(), get_priorities_numpy(groups).sum().item()
+
+
+def get_priorities_numpy(masks):
+    if np.any((masks == 0) | (masks & (masks - np.uint64(1)) != 0)):
+        raise Exception('Invalid item mask')
+
+    # Every mask is a power of two, which a float holds exactly
+    return np.frexp(masks.astype(np.float64))[1] - 1
+
+
+def get_priority(item: int):
+    if item and not item & (item - 1):
+        return item.bit_length() - 1
+    raise Exception(f'Invalid item mask: {item:#x}')
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
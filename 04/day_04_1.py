@@ -1,39 +1,28 @@
-from dataclasses import dataclass
-from typing import Self
+from operator import and_, ge, le, or_
+import re
+import sys
 
-@dataclass
-class Range:
-    min: int
-    max: int
+NUMBER_PATTERN = re.compile(rb'\d+')
 
-    def contains(self, other: Self):
-        return self.min <= other.min and self.max >= other.max
+def main(input_path: str = '04/input.txt'):
+    min1, max1, min2, max2 = read_sections(input_path)
 
-Pair = tuple[Range, Range]
+    # Compare whole columns at once rather than one pair at a time
+    first_contains = map(and_, map(le, min1, min2), map(ge, max1, max2))
+    second_contains = map(and_, map(le, min2, min1), map(ge, max2, max1))
 
-def main():
-    pairs = read_pairs()
-
-    count = 0
-
-    for pair in pairs:
-        if pair[0].contains(pair[1]) or pair[1].contains(pair[0]):
-            count += 1
+    count = sum(map(or_, first_contains, second_contains))
 
     print('Count:', count)
 
 
-def read_pairs():
-    with open('04/input.txt', encoding='ascii') as file:
-        return [parse_pair(line.strip()) for line in file]
-
-def parse_pair(line: str) -> Pair:
-    parts = line.split(',')
-    return (parse_range(parts[0]), parse_range(parts[1]))
+def read_sections(input_path: str):
+    # The four numbers of each line as four columns: the first elf's min and
+    # max, then the second elf's
+    with open(input_path, 'rb') as file:
+        numbers = list(map(int, NUMBER_PATTERN.findall(file.read())))
 
-def parse_range(range_str: str):
-    parts = range_str.split('-')
-    return Range(int(parts[0]), int(parts[1]))
+    return numbers[0::4], numbers[1::4], numbers[2::4], numbers[3::4]
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
@@ -1,37 +1,68 @@
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from typing import Self
+from operator import and_, ge, le
+import re
+import sys
 
 @dataclass
 class Range:
     min: int
     max: int
 
-    def contains(self, other: Self):
-        return self.min <= other.min and self.max >= other.max
+NUMBER_PATTERN = re.compile(rb'\d+')
 
-    def overlaps(self, other: Self):
-        return not (self.min > other.max or self.max < other.min)
 
-Pair = tuple[Range, Range]
+# Counts ranges against sorted lists of every min and max. A range overlaps
+# a query unless it ends before the query starts or starts after it ends,
+# and no range can do both, so each count is two bisects.
+class RangeIndex:
+    ranges: list[Range]
+    mins: list[int]
+    maxes: list[int]
 
-def main():
-    pairs = read_pairs()
+    def __init__(self, ranges: list[Range]):
+        self.ranges = ranges
+        self.mins = sorted(r.min for r in ranges)
+        self.maxes = sorted(r.max for r in ranges)
+
+    def count_containing(self, section: int):
+        return self.count_overlapping(Range(section, section))
+
+    def count_overlapping(self, other: Range):
+        return bisect_right(self.mins, other.max) - bisect_left(self.maxes, other.min)
+
+    def count_overlapping_pairs(self):
+        # Every range overlaps itself and each other pair is counted twice
+        return sum(self.count_overlapping(r) - 1 for r in self.ranges) // 2
+
+    def get_overlapping_any(self):
+        return [r for r in self.ranges if self.count_overlapping(r) > 1]
 
-    count = sum(1 for pair in pairs if pair[0].overlaps(pair[1]))
-    print('Count:', count)
 
+# Pass a section after the input path to also query every assignment in
+# the file, e.g. python 04/day_04_2.py 04/input.txt 42
+def main(input_path: str = '04/input.txt', section: int | str | None = None):
+    min1, max1, min2, max2 = read_sections(input_path)
+
+    if section is not None:
+        index = RangeIndex(list(map(Range, min1 + min2, max1 + max2)))
+
+        print('Assignments covering section:', index.count_containing(int(section)))
+        print('Overlapping assignment pairs:', index.count_overlapping_pairs())
+        print('Assignments overlapping another:', len(index.get_overlapping_any()))
+
+    # Compare whole columns at once rather than one pair at a time
+    count = sum(map(and_, map(le, min1, max2), map(ge, max1, min2)))
+    print('Count:', count)
 
-def read_pairs():
-    with open('04/input.txt', encoding='ascii') as file:
-        return [parse_pair(line.strip()) for line in file]
 
-def parse_pair(line: str) -> Pair:
-    parts = line.split(',')
-    return (parse_range(parts[0]), parse_range(parts[1]))
+def read_sections(input_path: str):
+    # The four numbers of each line as four columns: the first elf's min and
+    # max, then the second elf's
+    with open(input_path, 'rb') as file:
+        numbers = list(map(int, NUMBER_PATTERN.findall(file.read())))
 
-def parse_range(range_str: str):
-    parts = range_str.split('-')
-    return Range(int(parts[0]), int(parts[1]))
+    return numbers[0::4], numbers[1::4], numbers[2::4], numbers[3::4]
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
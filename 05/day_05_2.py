@@ -1,11 +1,13 @@
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass
+from itertools import repeat
+from typing import Iterable, Iterator
+from operator import add, sub
 import re
-import os
 import math
 import time
-
-def clear():
-    os.system('clear')
+import sys
 
 @dataclass
 class Step:
@@ -13,37 +15,109 @@ class Step:
     from_stack: int
     to_stack: int
 
+# A run of crates shared between stacks, read from crates[start:stop] or
+# in reverse, listed bottom to top
+@dataclass(slots=True)
+class Chunk:
+    crates: list[str]
+    start: int
+    stop: int
+    reverse: bool = False
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __getitem__(self, index: int):
+        return self.crates[self.stop - 1 - index] if self.reverse else self.crates[self.start + index]
+
+    def reversed(self):
+        return Chunk(self.crates, self.start, self.stop, not self.reverse)
+
+    def split(self, index: int):
+        # The bottom index crates and the rest
+        middle = self.stop - index if self.reverse else self.start + index
+
+        if self.reverse:
+            return Chunk(self.crates, middle, self.stop, True), Chunk(self.crates, self.start, middle, True)
+
+        return Chunk(self.crates, self.start, middle), Chunk(self.crates, middle, self.stop)
+
+
+# Crates are moved as whole chunks, with the height of the top of each
+# chunk kept alongside so a move can find where to split with a bisect
+class CrateStack:
+    chunks: list[Chunk]
+    tops: list[int]
+    size: int
+
+    def __init__(self, crates: list[str]):
+        self.chunks = [Chunk(crates, 0, len(crates))] if crates else []
+        self.tops = [len(crates)] if crates else []
+        self.size = len(crates)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self.size
+
+        if not 0 <= index < self.size:
+            raise IndexError('crate stack index out of range')
+
+        i = bisect_right(self.tops, index)
+        bottom = self.tops[i-1] if i else 0
+
+        return self.chunks[i][index - bottom]
+
+    def take(self, count: int):
+        # The top count crates as chunks, with the height of the top of each
+        # chunk counted from the bottom of the first
+        height = self.size - count
+        i = bisect_right(self.tops, height)
+        bottom = self.tops[i-1] if i else 0
+
+        chunks = self.chunks[i:]
+        tops = list(map(sub, self.tops[i:], repeat(height)))
+        del self.chunks[i:]
+        del self.tops[i:]
+
+        if bottom < height:
+            rest, chunks[0] = chunks[0].split(height - bottom)
+            self.chunks.append(rest)
+            self.tops.append(height)
+
+        self.size = height
+        return chunks, tops
+
+    def put(self, chunks: list[Chunk], tops: list[int]):
+        self.chunks.extend(chunks)
+        self.tops.extend(map(add, tops, repeat(self.size)))
+        self.size += tops[-1]
+
+
 class CrateMap:
-    stacks: list[list[str]]
+    stacks: list[CrateStack]
     stack_count: int
     max_height: int
 
     def __init__(self, stacks: list[list[str]]):
-        self.stacks = stacks
+        self.stacks = [CrateStack(crates) for crates in stacks]
         self.stack_count = len(stacks)
         self.max_height = 50
 
     def move(self, from_stack: int, to_stack: int, count: int):
-        crates = self.stacks[from_stack-1][-count:]
-        del self.stacks[from_stack-1][-count:]
-
-        self.stacks[to_stack-1].extend(crates)
+        chunks, tops = self.stacks[from_stack-1].take(count)
+        self.stacks[to_stack-1].put(chunks, tops)
 
     def __str__(self):
-        map_str = ''
-
-        for height in range(self.max_height-1, -1, -1):
-            for stack in self.stacks:
-                if height < len(stack):
-                    map_str += f'[{stack[height]}] '
-                else:
-                    map_str += '    '
-            map_str += '\n'
+        rows = [
+            ''.join(f'[{stack[height]}] ' if height < len(stack) else '    ' for stack in self.stacks)
+            for height in range(self.max_height-1, -1, -1)
+        ]
+        rows.append(''.join(f' {stack_index + 1}  ' for stack_index in range(self.stack_count)))
 
-        for stack_index, stack in enumerate(self.stacks):
-            map_str += f' {stack_index + 1}  '
-
-        return map_str
+        return '\n'.join(rows)
 
     def top_crates(self):
         return [stack[-1] for stack in self.stacks]
@@ -70,68 +144,186 @@ class Progress:
         return f'{self.bar_str()} {self.current} / {self.total} ({self.percent():.2f}%)'
 
 
-def main():
-    crate_map, procedure = parse_instructions()
+# Moves the cursor home and clears the screen
+CLEAR = '\x1b[H\x1b[2J'
+
+
+def move_cursor(row: int, column: int):
+    return f'\x1b[{row + 1};{column + 1}H'
+
+
+class Renderer:
+    frame_interval: float
+    last_frame_time: float | None
+    last_frame: list[str] | None
+
+    def __init__(self, fps: float):
+        self.frame_interval = 1 / fps
+        self.last_frame_time = None
+        self.last_frame = None
+
+    def draw(self, crate_map: CrateMap, progress: Progress, force: bool = False):
+        now = time.perf_counter()
+
+        # Skip frames that come too soon after the last one
+        if not force and self.last_frame_time is not None and now - self.last_frame_time < self.frame_interval:
+            return
+
+        self.last_frame_time = now
+
+        frame = f'{crate_map}\n\n{progress}'.split('\n')
+        output = [CLEAR] if self.last_frame is None else []
+        last_frame = self.last_frame or []
 
-    progress = Progress(len(procedure))
+        for row, line in enumerate(frame):
+            last_line = last_frame[row] if row < len(last_frame) else ''
 
-    clear()
-    print(crate_map)
-    print()
-    print(progress)
-    time.sleep(5)
+            if line != last_line:
+                output.extend(get_line_changes(row, line, last_line))
+
+        # Leave the cursor below the frame for anything printed afterwards
+        output.append(move_cursor(len(frame), 0))
+
+        sys.stdout.write(''.join(output))
+        sys.stdout.flush()
+
+        self.last_frame = frame
+
+
+def get_line_changes(row: int, line: str, last_line: str):
+    # Rewrite only the runs of characters that differ from the last frame
+    width = max(len(line), len(last_line))
+    line = line.ljust(width)
+    last_line = last_line.ljust(width)
+
+    changes: list[str] = []
+    column = 0
+
+    while column < width:
+        if line[column] == last_line[column]:
+            column += 1
+            continue
+
+        end = column
+
+        while end < width and line[end] != last_line[end]:
+            end += 1
+
+        changes.append(move_cursor(row, column) + line[column:end])
+        column = end
+
+    return changes
+
+
+# Pass a frame rate after the input path to watch the crates move, e.g.
+# python 05/day_05_2.py 05/input.txt 30
+def main(input_path: str = '05/input.txt', fps: float | str = 0):
+    # Steps are parsed as they are needed rather than read up front
+    with open(input_path, encoding='ascii') as file:
+        crate_map = parse_crate_map(file)
+        procedure = parse_procedure(file)
+
+        if float(fps) > 0:
+            step_count = count_steps(input_path)
+            top_crates = watch_procedure(crate_map, procedure, step_count, Renderer(float(fps)))
+        else:
+            top_crates = trace_top_crates(crate_map, procedure)
+
+    print('Top crates:', ''.join(top_crates))
+
+
+def watch_procedure(crate_map: CrateMap, procedure: Iterable[Step], step_count: int, renderer: Renderer):
+    progress = Progress(step_count)
+    renderer.draw(crate_map, progress, force=True)
 
     for step in procedure:
         progress.current += 1
 
         crate_map.move(step.from_stack, step.to_stack, step.count)
-        clear()
-        print(crate_map)
-        print()
-        print(progress)
+        renderer.draw(crate_map, progress)
 
-    print()
-    print('Top crates:', ''.join(crate_map.top_crates()))
+    renderer.draw(crate_map, progress, force=True)
 
+    return crate_map.top_crates()
 
-def parse_instructions():
-    with open('05/input.txt', encoding='ascii') as file:
-        crate_map_part, procedure_part = file.read().split('\n\n')
 
-    crate_map = parse_crate_map(crate_map_part)
-    procedure = parse_procedure(procedure_part)
+def trace_top_crates(crate_map: CrateMap, procedure: Iterable[Step]):
+    # Follow each final top position back through the procedure to the
+    # crate that started there, so the cost doesn't depend on step counts
+    heights = [len(stack) for stack in crate_map.stacks]
 
-    return crate_map, procedure
+    # The steps are replayed backwards, so keep them in compact arrays
+    counts = array('i')
+    from_stacks = array('i')
+    to_stacks = array('i')
 
+    for step in procedure:
+        heights[step.from_stack-1] -= step.count
+        heights[step.to_stack-1] += step.count
+
+        counts.append(step.count)
+        from_stacks.append(step.from_stack - 1)
+        to_stacks.append(step.to_stack - 1)
+
+    positions = [(stack, height - 1) for stack, height in enumerate(heights) if height > 0]
+
+    for count, from_stack, to_stack in zip(reversed(counts), reversed(from_stacks), reversed(to_stacks)):
+        # Undo the step so the heights are those from before it
+        heights[from_stack] += count
+        heights[to_stack] -= count
+
+        for i, (stack, index) in enumerate(positions):
+            if stack == to_stack and index >= heights[to_stack]:
+                offset = index - heights[to_stack]
+                positions[i] = (from_stack, heights[from_stack] - count + offset)
 
-def parse_crate_map(crate_map_str: str):
-    lines = crate_map_str.split('\n')
-    stack_numbers = lines.pop().split()
+    return [crate_map.stacks[stack][index] for stack, index in positions]
+
+
+def parse_crate_map(lines: Iterator[str]):
+    # Read up to the blank line before the procedure, leaving the rest
+    diagram: list[str] = []
+
+    for line in lines:
+        if not line.strip():
+            break
+
+        diagram.append(line.rstrip('\n'))
+
+    stack_numbers = diagram.pop().split()
     last_stack = int(stack_numbers[-1])
 
     stacks = [[] for _ in range(last_stack)]
 
-    for line in lines:
+    for line in reversed(diagram):
         for stack in range(last_stack):
             char_index = stack * 4 + 1
 
             if char_index < len(line):
                 char = line[char_index]
                 if char != ' ':
-                    stacks[stack].insert(0, char)
+                    stacks[stack].append(char)
 
     return CrateMap(stacks)
 
-def parse_procedure(procedure_str: str):
-    steps: list[Step] = []
 
-    for line in procedure_str.split('\n'):
-        result = re.match(r'move (\d+) from (\d+) to (\d+)', line)
+STEP_PATTERN = re.compile(r'move (\d+) from (\d+) to (\d+)')
+
+
+def parse_procedure(lines: Iterable[str]):
+    for line in lines:
+        if not line.strip():
+            continue
+
+        result = STEP_PATTERN.match(line)
         values = map(int, result.groups())
-        steps.append(Step(*values))
+        yield Step(*values)
+
 
-    return steps
+def count_steps(input_path: str):
+    with open(input_path, encoding='ascii') as file:
+        return sum(1 for line in file if line.startswith('move'))
 
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
@@ -1,19 +1,67 @@
+import re
+import sys
 MARKER_SIZE = 4
+CHUNK_SIZE = 1 << 16
+LINE_END = re.compile(rb'[\r\n]')
 
-def main():
-    datastream = read_datastream()
-    print('Start marker:', find_start_marker(datastream))
+def main(input_path: str = '06/input.txt'):
+    scanner = MarkerScanner([MARKER_SIZE])
 
-def find_start_marker(datastream: str):
-    for i in range(len(datastream) - MARKER_SIZE + 1):
-        unique_chars = len(set(datastream[i:i+MARKER_SIZE]))
-        if unique_chars == MARKER_SIZE:
-            return i + MARKER_SIZE
+    with open(input_path, 'rb') as file:
+        while not scanner.done and (chunk := file.read(CHUNK_SIZE)):
+            scanner.feed(chunk)
 
+    print('Start marker:', scanner.markers[MARKER_SIZE])
+
+
+# Finds where the first run of each marker size of distinct bytes ends in a
+# stream fed in chunks of any size. Only the last index each byte was seen
+# at and the start of the current run of distinct bytes carry over from one
+# chunk to the next, and one run serves every marker size. The datastream
+# is the first line, so nothing after its line ending is scanned.
+class MarkerScanner:
+    markers: dict[int, int | None]
+    pending_sizes: list[int]
+    last_seen: list[int]
+    start: int
+    offset: int
+    line_ended: bool
+
+    def __init__(self, sizes: list[int]):
+        self.markers = {size: None for size in sizes}
+        self.pending_sizes = sorted(sizes, reverse=True)
+        self.last_seen = [-1] * 256
+        self.start = 0
+        self.offset = 0
+        self.line_ended = False
+
+    @property
+    def done(self):
+        return not self.pending_sizes or self.line_ended
+
+    def feed(self, chunk: bytes):
+        if line_end := LINE_END.search(chunk):
+            chunk = chunk[:line_end.start()]
+            self.line_ended = True
+
+        last_seen = self.last_seen
+        start = self.start
+
+        for i, byte in enumerate(chunk, self.offset):
+            if last_seen[byte] >= start:
+                start = last_seen[byte] + 1
+
+            last_seen[byte] = i
+
+            while self.pending_sizes and i - start + 1 >= self.pending_sizes[-1]:
+                self.markers[self.pending_sizes.pop()] = i + 1
+
+            if not self.pending_sizes:
+                break
+
+        self.start = start
+        self.offset += len(chunk)
 
-def read_datastream():
-    with open('06/input.txt', encoding='ascii') as file:
-        return file.readline().strip()
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
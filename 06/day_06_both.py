@@ -0,0 +1,103 @@
+import asyncio
+import os
+import re
+import stat
+import sys
+
+MARKER_SIZES = [4, 14]
+CHUNK_SIZE = 1 << 16
+LINE_END = re.compile(rb'[\r\n]')
+
+# Finds the packet and message markers in one pass. Pass '-' as the input
+# path to read stdin, a pipe being read as it arrives, and comma separated
+# marker sizes after it to look for others, e.g.
+# some_command | python 06/day_06_both.py - 4,14,20
+def main(input_path: str = '06/input.txt', sizes: str | None = None):
+    scanner = MarkerScanner([int(size) for size in sizes.split(',')] if sizes else MARKER_SIZES)
+
+    if input_path == '-':
+        mode = os.fstat(sys.stdin.fileno()).st_mode
+
+        # The pipe transport only takes pipes and sockets, so a file
+        # redirected to stdin is read like any other
+        if stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode):
+            asyncio.run(scan_stdin(scanner))
+        else:
+            scan_file(sys.stdin.buffer, scanner)
+    else:
+        with open(input_path, 'rb') as file:
+            scan_file(file, scanner)
+
+    for size, marker in scanner.markers.items():
+        print(f'Start marker of {size}:', marker)
+
+
+def scan_file(file, scanner: 'MarkerScanner'):
+    while not scanner.done and (chunk := file.read(CHUNK_SIZE)):
+        scanner.feed(chunk)
+
+
+async def scan_stdin(scanner: 'MarkerScanner'):
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin.buffer)
+
+    await scan_reader(reader, scanner)
+
+
+async def scan_reader(reader: asyncio.StreamReader, scanner: 'MarkerScanner'):
+    while not scanner.done and (chunk := await reader.read(CHUNK_SIZE)):
+        scanner.feed(chunk)
+
+
+# Finds where the first run of each marker size of distinct bytes ends in a
+# stream fed in chunks of any size. Only the last index each byte was seen
+# at and the start of the current run of distinct bytes carry over from one
+# chunk to the next, and one run serves every marker size. The datastream
+# is the first line, so nothing after its line ending is scanned.
+class MarkerScanner:
+    markers: dict[int, int | None]
+    pending_sizes: list[int]
+    last_seen: list[int]
+    start: int
+    offset: int
+    line_ended: bool
+
+    def __init__(self, sizes: list[int]):
+        self.markers = {size: None for size in sizes}
+        self.pending_sizes = sorted(sizes, reverse=True)
+        self.last_seen = [-1] * 256
+        self.start = 0
+        self.offset = 0
+        self.line_ended = False
+
+    @property
+    def done(self):
+        return not self.pending_sizes or self.line_ended
+
+    def feed(self, chunk: bytes):
+        if line_end := LINE_END.search(chunk):
+            chunk = chunk[:line_end.start()]
+            self.line_ended = True
+
+        last_seen = self.last_seen
+        start = self.start
+
+        for i, byte in enumerate(chunk, self.offset):
+            if last_seen[byte] >= start:
+                start = last_seen[byte] + 1
+
+            last_seen[byte] = i
+
+            while self.pending_sizes and i - start + 1 >= self.pending_sizes[-1]:
+                self.markers[self.pending_sizes.pop()] = i + 1
+
+            if not self.pending_sizes:
+                break
+
+        self.start = start
+        self.offset += len(chunk)
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
+from collections import deque
+import sys
 
 TOTAL_SPACE    = 70000000
 REQUIRED_SPACE = 30000000
 
 class Item(ABC):
     name: str
+    parent: 'Directory | None' = None
 
     @abstractmethod
     def get_size(self) -> int:
@@ -34,19 +37,54 @@ class File(Item):
 class Directory(Item):
     name: str
     contents: list[Item]
+    subdirectories: dict[str, 'Directory']
+    size: int | None
 
     def __init__(self, name: str):
         self.name = name
         self.contents = []
+        self.subdirectories = {}
+        self.size = None
 
     def add(self, item: Item):
         self.contents.append(item)
+        item.parent = self
+
+        if isinstance(item, Directory):
+            self.subdirectories[item.name] = item
+
+        self.invalidate_size()
+
+    def invalidate_size(self):
+        # Stop at the first directory already missing its size, as all of
+        # its parents must be too
+        directory = self
+
+        while directory and directory.size is not None:
+            directory.size = None
+            directory = directory.parent
 
     def get_size(self):
-        return sum(item.get_size() for item in self.contents)
+        # Each subtree is summed once and kept until something is added to
+        # it. Missing sizes are filled in children first rather than by
+        # recursion, so deep trees don't run out of stack. A directory with
+        # a size has sizes throughout its subtree, so those are skipped.
+        if self.size is None:
+            unsized: list[Directory] = []
+            stack: list[Directory] = [self]
+
+            while stack:
+                directory = stack.pop()
+                unsized.append(directory)
+                stack.extend(subdirectory for subdirectory in directory.subdirectories.values() if subdirectory.size is None)
+
+            for directory in reversed(unsized):
+                directory.size = sum(item.get_size() for item in directory.contents)
+
+        return self.size
 
     def find_subdirectory(self, name: str):
-        return next(item for item in self.contents if item.name == name)
+        return self.subdirectories[name]
 
     def tree(self, depth=0):
         part = f'{self.tree_name(depth)} (dir)\n'
@@ -56,36 +94,31 @@ class Directory(Item):
 
         return part
 
-    def find_dirs_lte(self, size: int):
-        dirs: list[Directory] = []
-
-        if self.get_size() <= size:
-            dirs.append(self)
+    def walk_dirs(self):
+        # An explicit stack visits each directory once, where merging the
+        # lists returned for each subdirectory copied them at every level
+        stack: list[Directory] = [self]
 
-        for item in self.contents:
-            if isinstance(item, Directory):
-                dirs.extend(item.find_dirs_lte(size))
+        while stack:
+            directory = stack.pop()
+            yield directory
+            stack.extend(reversed(directory.subdirectories.values()))
 
-        return dirs
+    def find_dirs_lte(self, size: int):
+        return [directory for directory in self.walk_dirs() if directory.get_size() <= size]
 
     def get_dir_sizes(self):
-        sizes: list[int] = [self.get_size()]
-
-        for item in self.contents:
-            if isinstance(item, Directory):
-                sizes.extend(item.get_dir_sizes())
-
-        return sizes
+        return [directory.get_size() for directory in self.walk_dirs()]
 
 
-def main():
+def main(input_path: str = '07/input.txt'):
     root = Directory('/')
     current_path = [root]
 
-    terminal = read_terminal()
+    terminal = deque(read_terminal(input_path))
 
     while terminal:
-        line = terminal.pop(0)
+        line = terminal.popleft()
         parts = line.split()
 
         if parts[0] == '$':
@@ -100,7 +133,7 @@ def main():
                     current_path.append(new_dir)
             if parts[1] == 'ls':
                 while terminal and not terminal[0].startswith('$'):
-                    line = terminal.pop(0)
+                    line = terminal.popleft()
                     parts = line.split()
                     current_dir = current_path[-1]
                     if parts[0] == 'dir':
@@ -120,9 +153,9 @@ def main():
 
 
 
-def read_terminal():
-    with open('07/input.txt', encoding='ascii') as file:
+def read_terminal(input_path: str):
+    with open(input_path, encoding='ascii') as file:
         return file.readlines()
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
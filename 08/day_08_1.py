@@ -1,39 +1,67 @@
+import sys
 
-def main():
-    grid = read_grid()
+BORDER = 0xFF
+DIGITS = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+class Grid:
+    cells: bytearray
+    width: int
+    height: int
+    stride: int
+
+    def __init__(self, rows: list[bytes]):
+        self.width = len(rows[0])
+        self.height = len(rows)
+        self.stride = self.width + 2
+
+        # Pad with a border so walking off the edge never needs a bounds check
+        border_row = bytes([BORDER]) * self.stride
+        self.cells = bytearray(border_row)
+
+        for row in rows:
+            self.cells += bytes([BORDER]) + row + bytes([BORDER])
+
+        self.cells += border_row
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+
+def main(input_path: str = '08/input.txt'):
+    grid = read_grid(input_path)
     visible_trees = count_visible_trees(grid)
 
     print('Visible trees:', visible_trees)
 
-def count_visible_trees(grid: list[list[int]]):
-    visible_trees = 0
+def count_visible_trees(grid: Grid):
+    visible = bytearray(len(grid.cells))
+
+    for y in range(grid.height):
+        mark_visible_trees(grid, grid.index(0, y), 1, visible)
+        mark_visible_trees(grid, grid.index(grid.width - 1, y), -1, visible)
 
-    for y in range(len(grid)):
-        for x in range(len(grid[0])):
-            if is_tree_visible(grid, x, y):
-                visible_trees += 1
+    for x in range(grid.width):
+        mark_visible_trees(grid, grid.index(x, 0), grid.stride, visible)
+        mark_visible_trees(grid, grid.index(x, grid.height - 1), -grid.stride, visible)
 
-    return visible_trees
+    return sum(visible)
 
-def is_tree_visible(grid: list[list[int]], x: int, y: int):
-    this_height = grid[y][x]
+def mark_visible_trees(grid: Grid, index: int, step: int, visible: bytearray):
+    cells = grid.cells
+    tallest = -1
 
-    trees_west  = grid[y][:x]
-    trees_east  = grid[y][x+1:]
-    trees_north = [row[x] for row in grid[:y]]
-    trees_south = [row[x] for row in grid[y+1:]]
+    # A tree is visible from the edge if it is taller than every tree before it
+    while cells[index] != BORDER and tallest < 9:
+        if cells[index] > tallest:
+            tallest = cells[index]
+            visible[index] = 1
 
-    return (
-        all(tree < this_height for tree in trees_west) or
-        all(tree < this_height for tree in trees_east) or
-        all(tree < this_height for tree in trees_north) or
-        all(tree < this_height for tree in trees_south)
-    )
+        index += step
 
 
-def read_grid():
-    with open('08/input.txt', encoding='ascii') as file:
-        return [[int(cell) for cell in line.strip()] for line in file]
+def read_grid(input_path: str):
+    with open(input_path, 'rb') as file:
+        return Grid([line.strip().translate(DIGITS) for line in file])
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
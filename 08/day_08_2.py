@@ -1,61 +1,75 @@
+import sys
 
-DIRECTIONS = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+BORDER = 0xFF
+DIGITS = bytes.maketrans(b'0123456789', bytes(range(10)))
 
 class Grid:
-    cells: list[list[int]]
+    cells: bytearray
     width: int
     height: int
+    stride: int
 
-    def __init__(self, cells: list[list[int]]):
-        self.cells = cells
-        self.width = len(cells[0])
-        self.height = len(cells)
+    def __init__(self, rows: list[bytes]):
+        self.width = len(rows[0])
+        self.height = len(rows)
+        self.stride = self.width + 2
+
+        # Pad with a border so walking off the edge never needs a bounds check
+        border_row = bytes([BORDER]) * self.stride
+        self.cells = bytearray(border_row)
+
+        for row in rows:
+            self.cells += bytes([BORDER]) + row + bytes([BORDER])
+
+        self.cells += border_row
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
 
     def get_max_scenic_score(self):
         max_scenic_score = 0
 
         for y in range(self.height):
             for x in range(self.width):
-                scenic_score = self.get_scenic_score(x, y)
+                scenic_score = self.get_scenic_score(self.index(x, y))
                 max_scenic_score = max(max_scenic_score, scenic_score)
 
         return max_scenic_score
 
-    def get_scenic_score(self, x: int, y: int):
+    def get_scenic_score(self, index: int):
         viewing_distances = 1
 
-        for direction in DIRECTIONS:
-            viewing_distances *= self.get_viewing_distance(x, y,  direction[0], direction[1])
+        for step in (-self.stride, self.stride, -1, 1):
+            viewing_distances *= self.get_viewing_distance(index, step)
 
         return viewing_distances
 
-    def get_viewing_distance(self, x: int, y: int, dx: int, dy: int):
-        this_height = self.cells[y][x]
-        x += dx
-        y += dy
+    def get_viewing_distance(self, index: int, step: int):
+        cells = self.cells
+        this_height = cells[index]
+        index += step
 
         viewing_distance = 0
 
-        while x >= 0 and x < self.width and y >= 0 and y < self.height:
+        while cells[index] != BORDER:
             viewing_distance += 1
 
-            if self.cells[y][x] >= this_height:
+            if cells[index] >= this_height:
                 break
 
-            x += dx
-            y += dy
+            index += step
 
         return viewing_distance
 
 
-def main():
-    grid = read_grid()
+def main(input_path: str = '08/input.txt'):
+    grid = read_grid(input_path)
     print(grid.get_max_scenic_score())
 
 
-def read_grid():
-    with open('08/input.txt', encoding='ascii') as file:
-        return Grid([[int(cell) for cell in line.strip()] for line in file])
+def read_grid(input_path: str):
+    with open(input_path, 'rb') as file:
+        return Grid([line.strip().translate(DIGITS) for line in file])
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
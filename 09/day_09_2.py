@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from typing import Self
+from typing import Self, NamedTuple
+import sys
 
-@dataclass(frozen=True)
-class Point:
+class Point(NamedTuple):
     x: int
     y: int
 
@@ -61,8 +61,8 @@ class Rope:
 
             self.points[head_index+1] += Point(dx, dy)
 
-def main():
-    motions = read_motions()
+def main(input_path: str = '09/input.txt'):
+    motions = read_motions(input_path)
     rope = Rope(10)
 
     for motion in motions:
@@ -70,8 +70,8 @@ def main():
 
     print('Tail visited:', len(rope.tail_visited))
 
-def read_motions():
-    with open('09/input.txt', encoding='ascii') as file:
+def read_motions(input_path: str):
+    with open(input_path, encoding='ascii') as file:
         return [parse_motion(line.strip()) for line in file]
 
 def parse_motion(line: str):
@@ -79,4 +79,4 @@ def parse_motion(line: str):
     return Motion(DIRECTIONS[parts[0]], int(parts[1]))
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
@@ -1,12 +1,13 @@
 from typing import NamedTuple
+import sys
 
 
 class Instruction(NamedTuple):
     type: str
     value: int | None
 
-def main():
-    instructions = read_instructions()
+def main(input_path: str = '10/input.txt'):
+    instructions = read_instructions(input_path)
     register_x = 1
     cycle = 1
 
@@ -36,8 +37,8 @@ def main():
     print('Signal strength sum:', signal_strength_sum)
 
 
-def read_instructions():
-    with open('10/input.txt', encoding='ascii') as file:
+def read_instructions(input_path: str):
+    with open(input_path, encoding='ascii') as file:
         return [parse_instruction(line) for line in file]
 
 def parse_instruction(line: str):
@@ -50,4 +51,4 @@ def parse_instruction(line: str):
     return Instruction(parts[0], value)
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
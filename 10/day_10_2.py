@@ -1,4 +1,5 @@
 from typing import NamedTuple
+import sys
 
 class Instruction(NamedTuple):
     type: str
@@ -34,8 +35,8 @@ class Crt:
         return output
 
 
-def main():
-    instructions = read_instructions()
+def main(input_path: str = '10/input.txt'):
+    instructions = read_instructions(input_path)
 
     crt = Crt()
 
@@ -65,8 +66,8 @@ def main():
     print(crt)
 
 
-def read_instructions():
-    with open('10/input.txt', encoding='ascii') as file:
+def read_instructions(input_path: str):
+    with open(input_path, encoding='ascii') as file:
         return [parse_instruction(line) for line in file]
 
 def parse_instruction(line: str):
@@ -79,4 +80,4 @@ def parse_instruction(line: str):
     return Instruction(parts[0], value)
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
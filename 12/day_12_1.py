@@ -1,107 +1,103 @@
-from dataclasses import dataclass
+from collections import deque
+from typing import NamedTuple
+import sys
 
-@dataclass(frozen=True)
-class Point:
+class Point(NamedTuple):
     x: int
     y: int
 
-DIRECTIONS = [Point(-1, 0), Point(1, 0), Point(0, -1), Point(0, 1)]
+# Cells outside the map are too high to climb onto
+BORDER = 0xFF
 
 
 class HeightMap:
-    height_map: list[list[str]]
+    cells: bytearray
     width: int
     height: int
+    stride: int
+    offsets: tuple[int, ...]
     start: Point
     end: Point
 
-    def __init__(self, height_map: list[list[str]], start: Point, end: Point):
-        self.height_map = height_map
-        self.width = len(height_map[0])
-        self.height = len(height_map)
+    def __init__(self, rows: list[str], start: Point, end: Point):
+        self.width = len(rows[0])
+        self.height = len(rows)
+        self.stride = self.width + 2
+        self.offsets = (-1, 1, -self.stride, self.stride)
         self.start = start
         self.end = end
 
-    def get_height_at(self, point: Point):
-        return self.height_map[point.y][point.x]
+        border_row = bytes([BORDER]) * self.stride
+        self.cells = bytearray(border_row)
 
-    def is_valid_neighbour(self, point: Point, neighbour: Point):
-        if neighbour.x < 0 or neighbour.x >= self.width:
-            return False
+        for row in rows:
+            self.cells += bytes([BORDER]) + row.encode('ascii') + bytes([BORDER])
 
-        if neighbour.y < 0 or neighbour.y >= self.height:
-            return False
+        self.cells += border_row
 
-        current_height = self.get_height_at(point)
-        neighbour_height = self.get_height_at(neighbour)
-
-        return ord(neighbour_height) <= ord(current_height) + 1
-
-
-    def get_valid_neighbours(self, point: Point):
-        valid_neighbours: list[Point] = []
-
-        for direction in DIRECTIONS:
-            neighbour = Point(point.x + direction.x, point.y + direction.y)
-            if self.is_valid_neighbour(point, neighbour):
-                valid_neighbours.append(neighbour)
-
-        return valid_neighbours
+    def index(self, point: Point):
+        return (point.y + 1) * self.stride + point.x + 1
 
+    def get_height_at(self, index: int):
+        return chr(self.cells[index])
 
+    def get_valid_neighbours(self, index: int):
+        current_height = self.cells[index]
 
+        return [
+            index + offset for offset in self.offsets
+            if self.cells[index + offset] <= current_height + 1
+        ]
 
     @classmethod
     def from_input_lines(cls, lines: list[str]):
-        rows: list[list[str]] = []
+        rows: list[str] = []
         start: Point | None = None
         end: Point | None = None
 
         for y, line in enumerate(lines):
-            row: list[int] = []
+            row = line.strip()
 
-            for x, cell in enumerate(line.strip()):
-                if cell == 'S':
-                    start = Point(x, y)
-                    cell = 'a'
-                elif cell == 'E':
-                    end = Point(x, y)
-                    cell = 'z'
+            if 'S' in row:
+                start = Point(row.index('S'), y)
+            if 'E' in row:
+                end = Point(row.index('E'), y)
 
-                row.append(cell)
-            rows.append(row)
+            rows.append(row.replace('S', 'a').replace('E', 'z'))
 
         assert start and end
         return HeightMap(rows, start, end)
 
 
 
-def main():
-    height_map = read_height_map()
+def main(input_path: str = '12/input.txt'):
+    height_map = read_height_map(input_path)
+
+    start = height_map.index(height_map.start)
+    end = height_map.index(height_map.end)
 
-    queue = [height_map.start]
-    distances: dict[Point, int] = {height_map.start: 0}
+    queue = deque([start])
+    distances = [-1] * len(height_map.cells)
+    distances[start] = 0
 
     while queue:
-        current = queue.pop(0)
+        current = queue.popleft()
 
-        if current == height_map.end:
+        if current == end:
             break
 
-        neighbours = height_map.get_valid_neighbours(current)
-
-        for neighbour in neighbours:
-            if neighbour not in distances:
+        for neighbour in height_map.get_valid_neighbours(current):
+            if distances[neighbour] < 0:
                 queue.append(neighbour)
                 distances[neighbour] = distances[current] + 1
 
-    print('Steps:', distances[height_map.end])
+    print('Steps:', distances[end])
 
 
-def read_height_map():
-    with open('12/input.txt', encoding='ascii') as file:
+def read_height_map(input_path: str):
+    with open(input_path, encoding='ascii') as file:
         return HeightMap.from_input_lines(file.readlines())
 
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
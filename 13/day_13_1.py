@@ -1,10 +1,11 @@
 from typing import Union
+import sys
 
 Packet = list[Union[int, 'Packet']]
 
 
-def main():
-    packet_pairs = read_packet_pairs()
+def main(input_path: str = '13/input.txt'):
+    packet_pairs = read_packet_pairs(input_path)
 
     sum_indices = 0
 
@@ -42,8 +43,8 @@ def compare_packets(packet1: Packet, packet2: Packet):
     return 0
 
 
-def read_packet_pairs():
-    with open('13/input.txt', encoding='ascii') as file:
+def read_packet_pairs(input_path: str):
+    with open(input_path, encoding='ascii') as file:
         data = file.read()
 
     chunks = data.split('\n\n')
@@ -87,4 +88,4 @@ def parse_packet(line: list[str]) -> Packet:
     raise Exception('Invalid packet')
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
@@ -1,11 +1,12 @@
 import functools
 from typing import Union
+import sys
 
 Packet = list[Union[int, 'Packet']]
 
 
-def main():
-    packets = read_packets()
+def main(input_path: str = '13/input.txt'):
+    packets = read_packets(input_path)
     packets.append([[2]])
     packets.append([[6]])
 
@@ -39,8 +40,8 @@ def compare_packets(packet1: Packet, packet2: Packet):
 
     return 0
 
-def read_packets():
-    with open('13/input.txt', encoding='ascii') as file:
+def read_packets(input_path: str):
+    with open(input_path, encoding='ascii') as file:
         return [parse_packet(list(line.strip())) for line in file if line.strip()]
 
 def parse_packet(line: list[str]) -> Packet:
@@ -72,4 +73,4 @@ def parse_packet(line: list[str]) -> Packet:
     raise Exception('Invalid packet')
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
@@ -1,12 +1,11 @@
-from dataclasses import dataclass
-from typing import Self
+from typing import Self, NamedTuple
 import os
+import sys
 
 def clear():
     os.system('clear')
 
-@dataclass(frozen=True)
-class Point:
+class Point(NamedTuple):
     x: int
     y: int
 
@@ -22,18 +21,41 @@ class Point:
             self.y - other.y
         )
 
+SAND_SOURCE = Point(500, 0)
+
+EMPTY = ord('.')
+WALL = ord('#')
+SAND = ord('o')
+
 
 class CaveMap:
-    walls: set[Point]
-    sand: set[Point]
+    cells: bytearray
+    stride: int
+    grid_x_min: int
+    sand_count: int
     x_min: int
     x_max: int
     y_min: int
     y_max: int
 
-    def __init__(self):
-        self.walls = set()
-        self.sand = set()
+    def __init__(self, wall_points: list[Point]):
+        self.x_min = min(p.x for p in wall_points)
+        self.x_max = max(p.x for p in wall_points)
+        self.y_min = min(p.y for p in wall_points)
+        self.y_max = max(p.y for p in wall_points)
+
+        # Sand piles up in a triangle below the source so it can spread up to
+        # y_max + 2 either side of it, plus a spare column for falling past the edge
+        spread = self.y_max + 2
+        self.grid_x_min = min(self.x_min, SAND_SOURCE.x - spread) - 1
+        grid_x_max = max(self.x_max, SAND_SOURCE.x + spread) + 1
+
+        self.stride = grid_x_max - self.grid_x_min + 1
+        self.cells = bytearray([EMPTY]) * (self.stride * (self.y_max + 3))
+        self.sand_count = 0
+
+    def index(self, point: Point):
+        return point.y * self.stride + point.x - self.grid_x_min
 
     def add_wall_line(self, start: Point, end: Point):
         if start.x == end.x:
@@ -54,43 +76,35 @@ class CaveMap:
             raise Exception('Invalid wall line')
 
     def _add_wall(self, point: Point):
-        if not self.walls or point.x < self.x_min:
-            self.x_min = point.x
-
-        if not self.walls or point.x > self.x_max:
-            self.x_max = point.x
-
-        if not self.walls or point.y < self.y_min:
-            self.y_min = point.y
-
-        if not self.walls or point.y > self.y_max:
-            self.y_max = point.y
-
-        self.walls.add(point)
+        self.cells[self.index(point)] = WALL
 
     def is_wall(self, point: Point):
-        return point in self.walls
+        return self.cells[self.index(point)] == WALL
 
     def is_sand(self, point: Point):
-        return point in self.sand
+        return self.cells[self.index(point)] == SAND
 
     def is_filled(self, point: Point):
-        return self.is_wall(point) or self.is_sand(point)
+        return self.cells[self.index(point)] != EMPTY
 
     def add_sand(self, point: Point):
-        while point.y <= self.y_max:
-            down_point = Point(point.x, point.y + 1)
-            down_left_point = Point(point.x - 1, point.y + 1)
-            down_right_point = Point(point.x + 1, point.y + 1)
-
-            if not self.is_filled(down_point):
-                point = down_point
-            elif not self.is_filled(down_left_point):
-                point = down_left_point
-            elif not self.is_filled(down_right_point):
-                point = down_right_point
+        cells = self.cells
+        stride = self.stride
+        index = self.index(point)
+        abyss = (self.y_max + 1) * self.stride
+
+        while index < abyss:
+            below = index + stride
+
+            if cells[below] == EMPTY:
+                index = below
+            elif cells[below - 1] == EMPTY:
+                index = below - 1
+            elif cells[below + 1] == EMPTY:
+                index = below + 1
             else:
-                self.sand.add(point)
+                cells[index] = SAND
+                self.sand_count += 1
                 return True
 
         return False
@@ -112,13 +126,13 @@ class CaveMap:
         return output
 
 
-def main():
-    cave_map = read_cave_map()
+def main(input_path: str = '14/input.txt'):
+    cave_map = read_cave_map(input_path)
     # clear()
     # print(cave_map)
 
     while True:
-        did_add = cave_map.add_sand(Point(500, 0))
+        did_add = cave_map.add_sand(SAND_SOURCE)
 
         if not did_add:
             break
@@ -127,17 +141,17 @@ def main():
         # clear()
         # print(cave_map_str)
 
-    print('Units of sand:', len(cave_map.sand))
+    print('Units of sand:', cave_map.sand_count)
 
-def read_cave_map():
-    cave_map = CaveMap()
+def read_cave_map(input_path: str):
+    with open(input_path, encoding='ascii') as file:
+        wall_lines = [parse_wall_line(line) for line in file]
 
-    with open('14/input.txt', encoding='ascii') as file:
-        for line in file:
-            wall_line = parse_wall_line(line)
+    cave_map = CaveMap([point for wall_line in wall_lines for point in wall_line])
 
-            for i in range(len(wall_line) - 1):
-                cave_map.add_wall_line(wall_line[i], wall_line[i+1])
+    for wall_line in wall_lines:
+        for i in range(len(wall_line) - 1):
+            cave_map.add_wall_line(wall_line[i], wall_line[i+1])
 
     return cave_map
 
@@ -152,4 +166,4 @@ def parse_point(point_str: str):
 
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
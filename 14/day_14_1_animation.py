@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Self
 from PIL import Image, ImageDraw
+import sys
 
 IMAGE_SCALE = 2
 
@@ -115,8 +116,8 @@ class CaveMap:
         return image
 
 
-def main():
-    cave_map = read_cave_map()
+def main(input_path: str = '14/input.txt'):
+    cave_map = read_cave_map(input_path)
     images = [cave_map.to_image()]
 
     while True:
@@ -146,10 +147,10 @@ def main():
     )
 
 
-def read_cave_map():
+def read_cave_map(input_path: str):
     cave_map = CaveMap()
 
-    with open('14/input.txt', encoding='ascii') as file:
+    with open(input_path, encoding='ascii') as file:
         for line in file:
             wall_line = parse_wall_line(line)
 
@@ -169,4 +170,4 @@ def parse_point(point_str: str):
 
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
@@ -1,5 +1,6 @@
 from typing import NamedTuple, Self
 import re
+import sys
 
 class Point(NamedTuple):
     x: int
@@ -31,8 +32,8 @@ class Sensor:
         return (self.pos.x - x_range, self.pos.x + x_range)
 
 
-def main():
-    sensors = read_sensors()
+def main(input_path: str = '15/input.txt'):
+    sensors = read_sensors(input_path)
     beacon_positions = {sensor.closest_beacon for sensor in sensors}
 
     not_beacon_points: set[Point] = set()
@@ -52,8 +53,8 @@ def main():
     print('Not beacon points:', len(not_beacon_points))
 
 
-def read_sensors() -> list[Sensor]:
-    with open('15/input.txt', encoding='ascii') as file:
+def read_sensors(input_path: str) -> list[Sensor]:
+    with open(input_path, encoding='ascii') as file:
         return [parse_sensor(line) for line in file]
 
 def parse_sensor(line: str) -> Sensor:
@@ -66,4 +67,4 @@ def parse_sensor(line: str) -> Sensor:
 
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
@@ -1,5 +1,6 @@
 from typing import NamedTuple, Self
 import re
+import sys
 
 class Point(NamedTuple):
     x: int
@@ -36,9 +37,9 @@ class Sensor:
         return dist <= self.range
 
 
-def main():
+def main(input_path: str = '15/input.txt'):
     max_pos = 4000000
-    sensors = read_sensors()
+    sensors = read_sensors(input_path)
 
     for sensor_index, sensor in enumerate(sensors):
         print('Checking sensor:', sensor_index)
@@ -59,8 +60,8 @@ def is_inside_any_range(point: Point, sensors: list[Sensor]) -> bool:
     return False
 
 
-def read_sensors() -> list[Sensor]:
-    with open('15/input.txt', encoding='ascii') as file:
+def read_sensors(input_path: str) -> list[Sensor]:
+    with open(input_path, encoding='ascii') as file:
         return [parse_sensor(line) for line in file]
 
 def parse_sensor(line: str) -> Sensor:
@@ -73,4 +74,4 @@ def parse_sensor(line: str) -> Sensor:
 
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
@@ -1,6 +1,8 @@
+from collections import deque
 from dataclasses import dataclass
 from functools import cache
 import re
+import sys
 
 @dataclass
 class Valve:
@@ -25,29 +27,28 @@ class TunnelGraph:
         self.edges[node2].add(node1)
 
     @cache
-    def shortest_dist(self, start: str, end: str) -> int | None:
-        explored = set(start)
+    def distances_from(self, start: str) -> dict[str, int]:
         distances = {start: 0}
-        queue = [start]
+        queue = deque([start])
 
         while queue:
-            node = queue.pop(0)
-
-            if node == end:
-                return distances[node]
+            node = queue.popleft()
 
             for neighbour in self.edges[node]:
-                if neighbour not in explored:
-                    explored.add(neighbour)
+                if neighbour not in distances:
                     distances[neighbour] = distances[node] + 1
                     queue.append(neighbour)
 
-        return None
+        return distances
+
+    @cache
+    def shortest_dist(self, start: str, end: str) -> int | None:
+        return self.distances_from(start).get(end)
 
 
 
-def main():
-    valves = read_valves()
+def main(input_path: str = '16/input.txt'):
+    valves = read_valves(input_path)
     tunnel_graph = create_tunnel_graph(valves)
 
     working_valves = [v for v in valves if v.flow_rate > 0]
@@ -86,8 +87,8 @@ def create_tunnel_graph(valves: list[Valve]) -> TunnelGraph:
 
     return tunnel_graph
 
-def read_valves() -> list[Valve]:
-    with open('16/input.txt', encoding='ascii') as file:
+def read_valves(input_path: str) -> list[Valve]:
+    with open(input_path, encoding='ascii') as file:
         return [parse_valve(line) for line in file]
 
 def parse_valve(line: str) -> Valve:
@@ -98,4 +99,4 @@ def parse_valve(line: str) -> Valve:
     return Valve(name, flow_rate, tunnels)
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
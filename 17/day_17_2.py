@@ -1,5 +1,6 @@
 from typing import Iterable, NamedTuple
 from itertools import cycle
+import sys
 
 class Point(NamedTuple):
     x: int
@@ -98,8 +99,8 @@ class Chamber:
 
 
 
-def main():
-    jets = read_jets()
+def main(input_path: str = '17/input.txt'):
+    jets = read_jets(input_path)
     chamber = Chamber(jets)
 
     steps = len(jets) * 5
@@ -146,10 +147,10 @@ def main():
     print('Total height:', chamber.tower.height + extra_height)
 
 
-def read_jets():
-    with open('17/input.txt', encoding='ascii') as file:
+def read_jets(input_path: str):
+    with open(input_path, encoding='ascii') as file:
         return list(file.readline().strip())
 
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
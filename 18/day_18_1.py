@@ -1,3 +1,4 @@
+import sys
 
 DIRECTIONS = [
     (0, 0, 1),
@@ -8,8 +9,8 @@ DIRECTIONS = [
     (-1, 0, 0)
 ]
 
-def main():
-    cubes = read_cubes()
+def main(input_path: str = '18/input.txt'):
+    cubes = read_cubes(input_path)
 
     surface_area = 0
 
@@ -24,10 +25,10 @@ def main():
 
 
 
-def read_cubes() -> set[tuple[int, int, int]]:
-    with open('18/input.txt', encoding='ascii') as file:
+def read_cubes(input_path: str) -> set[tuple[int, int, int]]:
+    with open(input_path, encoding='ascii') as file:
         return {tuple(map(int, line.strip().split(','))) for line in file}
 
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
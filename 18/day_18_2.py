@@ -1,3 +1,5 @@
+from collections import deque
+import sys
 
 Cube = tuple[int, int, int]
 
@@ -10,34 +12,55 @@ DIRECTIONS: list[Cube] = [
     (-1, 0, 0)
 ]
 
-def main():
-    cubes = read_cubes()
+AIR = 0
+LAVA = 1
+STEAM = 2
+BORDER = 3
+
+def main(input_path: str = '18/input.txt'):
+    cubes = read_cubes(input_path)
 
     mins: Cube = tuple([min(cube[d] for cube in cubes) - 1 for d in range(3)])
     maxs: Cube = tuple([max(cube[d] for cube in cubes) + 1 for d in range(3)])
 
-    steam_cubes: set[Cube] = {mins}
-    queue: list[Cube] = [maxs]
+    # Flat grid over the bounding box plus a layer of border cells, so the
+    # flood fill never needs a bounds check
+    sizes = [maxs[d] - mins[d] + 3 for d in range(3)]
+    offsets = [sizes[1] * sizes[2], sizes[2], 1]
+    neighbour_offsets = [sum(o * v for o, v in zip(offsets, direction)) for direction in DIRECTIONS]
 
-    while queue:
-        cube = queue.pop(0)
+    def index(cube: Cube) -> int:
+        return sum((cube[d] - mins[d] + 1) * offsets[d] for d in range(3))
 
-        for direction in DIRECTIONS:
-            other_cube = tuple(sum(v) for v in zip(cube, direction))
+    cells = bytearray([BORDER]) * (sizes[0] * sizes[1] * sizes[2])
 
-            if other_cube in steam_cubes:
-                continue
+    for x in range(mins[0], maxs[0] + 1):
+        for y in range(mins[1], maxs[1] + 1):
+            start = index((x, y, mins[2]))
+            cells[start:start + sizes[2] - 2] = bytes([AIR]) * (sizes[2] - 2)
 
-            if other_cube in cubes:
-                continue
+    for cube in cubes:
+        cells[index(cube)] = LAVA
 
-            if not is_cube_in_big_cube(other_cube, mins, maxs):
-                continue
+    start = index(maxs)
+    cells[start] = STEAM
+    queue = deque([start])
+
+    while queue:
+        current = queue.popleft()
 
-            steam_cubes.add(other_cube)
-            queue.append(other_cube)
+        for offset in neighbour_offsets:
+            neighbour = current + offset
 
-    steam_surface_area = surface_area_of_cubes(steam_cubes)
+            if cells[neighbour] == AIR:
+                cells[neighbour] = STEAM
+                queue.append(neighbour)
+
+    steam_surface_area = sum(
+        cells[current + offset] != STEAM
+        for current, cell in enumerate(cells) if cell == STEAM
+        for offset in neighbour_offsets
+    )
     outside_surface_area = surface_area_of_cube(
         maxs[0] - mins[0] + 1,
         maxs[1] - mins[1] + 1,
@@ -53,36 +76,14 @@ def main():
 
 
 
-def is_cube_in_big_cube(cube: Cube, mins: Cube, maxs: Cube):
-    for dim in range(3):
-        if cube[dim] < mins[dim] or cube[dim] > maxs[dim]:
-            return False
-
-    return True
-
-
 def surface_area_of_cube(length: int, width: int, height: int) -> int:
     return (length * width * 2) + (length * height * 2) + (width * height * 2)
 
 
-def surface_area_of_cubes(cubes: set[Cube]) -> int:
-    surface_area = 0
-
-    for cube in cubes:
-        for direction in DIRECTIONS:
-            other_cube = tuple(sum(v) for v in zip(cube, direction))
-
-            if other_cube not in cubes:
-                surface_area += 1
-
-    return surface_area
-
-
-
-def read_cubes() -> set[Cube]:
-    with open('18/input.txt', encoding='ascii') as file:
+def read_cubes(input_path: str) -> set[Cube]:
+    with open(input_path, encoding='ascii') as file:
         return {tuple(map(int, line.strip().split(','))) for line in file}
 
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
@@ -1,5 +1,6 @@
 from typing import NamedTuple
 import re
+import sys
 
 DURATION = 24
 
@@ -102,8 +103,8 @@ def get_next_states(state: State, blueprint: Blueprint) -> list[State]:
     return next_states
 
 
-def main():
-    blueprints = read_blueprints()
+def main(input_path: str = '19/input.txt'):
+    blueprints = read_blueprints(input_path)
     quality_level_sum = 0
 
     for blueprint in blueprints:
@@ -114,8 +115,8 @@ def main():
 
     print('Quality level sum:', quality_level_sum)
 
-def read_blueprints() -> list[Blueprint]:
-    with open('19/input.txt', encoding='ascii') as file:
+def read_blueprints(input_path: str) -> list[Blueprint]:
+    with open(input_path, encoding='ascii') as file:
         return [parse_blueprint(line) for line in file]
 
 def parse_blueprint(line: str) -> Blueprint:
@@ -131,4 +132,4 @@ def parse_blueprint(line: str) -> Blueprint:
     )
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
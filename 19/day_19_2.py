@@ -2,6 +2,7 @@ from functools import cache
 from typing import NamedTuple
 import re
 import heapq
+import sys
 
 DURATION = 32
 
@@ -118,8 +119,8 @@ def get_next_states(state: State, blueprint: Blueprint) -> list[State]:
     return next_states
 
 
-def main():
-    blueprints = read_blueprints()[:3]
+def main(input_path: str = '19/input.txt'):
+    blueprints = read_blueprints(input_path)[:3]
     geode_mult = 1
 
     for blueprint in blueprints:
@@ -129,8 +130,8 @@ def main():
 
     print('Geodes Multiplied:', geode_mult)
 
-def read_blueprints() -> list[Blueprint]:
-    with open('19/input.txt', encoding='ascii') as file:
+def read_blueprints(input_path: str) -> list[Blueprint]:
+    with open(input_path, encoding='ascii') as file:
         return [parse_blueprint(line) for line in file]
 
 def parse_blueprint(line: str) -> Blueprint:
@@ -146,4 +147,4 @@ def parse_blueprint(line: str) -> Blueprint:
     )
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
@@ -1,6 +1,7 @@
+import sys
 
-def main():
-    numbers = read_numbers()
+def main(input_path: str = '20/input.txt'):
+    numbers = read_numbers(input_path)
 
     indices = list(range(len(numbers)))
 
@@ -21,10 +22,10 @@ def main():
 
     print('Grove coordinates:', grove_coordinates)
 
-def read_numbers():
-    with open('20/input.txt', encoding='ascii') as file:
+def read_numbers(input_path: str):
+    with open(input_path, encoding='ascii') as file:
         return [int(line) for line in file]
 
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
@@ -1,9 +1,10 @@
+import sys
 
 DECRYPTION_KEY = 811589153
 NUM_ROUNDS = 10
 
-def main():
-    numbers = read_numbers()
+def main(input_path: str = '20/input.txt'):
+    numbers = read_numbers(input_path)
     numbers = [n * DECRYPTION_KEY for n in numbers]
 
     indices = list(range(len(numbers)))
@@ -26,10 +27,10 @@ def main():
 
     print('Grove coordinates:', grove_coordinates)
 
-def read_numbers():
-    with open('20/input.txt', encoding='ascii') as file:
+def read_numbers(input_path: str):
+    with open(input_path, encoding='ascii') as file:
         return [int(line) for line in file]
 
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
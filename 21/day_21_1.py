@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from abc import ABC
+import sys
 
 @dataclass
 class Monkey(ABC):
@@ -15,8 +16,8 @@ class ExpressionMonkey(Monkey):
     operation: str
     right: str
 
-def main():
-    monkeys = read_monkeys()
+def main(input_path: str = '21/input.txt'):
+    monkeys = read_monkeys(input_path)
     root_result = calculate('root', monkeys)
     print('Root result:', root_result)
 
@@ -40,8 +41,8 @@ def calculate(name: str, monkeys: dict[str, Monkey]) -> int:
         raise Exception('Invalid monkey')
 
 
-def read_monkeys():
-    with open('21/input.txt', encoding='ascii') as file:
+def read_monkeys(input_path: str):
+    with open(input_path, encoding='ascii') as file:
         monkeys = [parse_monkey(line) for line in file]
         return {monkey.name: monkey for monkey in monkeys}
 
@@ -56,5 +57,5 @@ def parse_monkey(line: str) -> Monkey:
         return ExpressionMonkey(name, parts[1], parts[2], parts[3])
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
 
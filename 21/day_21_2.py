@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
+import sys
 
 
 @dataclass
@@ -54,8 +55,8 @@ class ExpressionMonkey(Monkey):
         return self.left.contains_human() or self.right.contains_human()
 
 
-def main():
-    monkeys = read_monkeys()
+def main(input_path: str = '21/input.txt'):
+    monkeys = read_monkeys(input_path)
 
     for monkey in monkeys.values():
         if isinstance(monkey, ExpressionMonkey):
@@ -112,8 +113,8 @@ def main():
 
 
 
-def read_monkeys():
-    with open('21/input.txt', encoding='ascii') as file:
+def read_monkeys(input_path: str):
+    with open(input_path, encoding='ascii') as file:
         monkeys = [parse_monkey(line) for line in file]
         return {monkey.name: monkey for monkey in monkeys}
 
@@ -128,4 +129,4 @@ def parse_monkey(line: str) -> Monkey:
         return ExpressionMonkey(name, parts[1], parts[2], parts[3])
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
@@ -1,12 +1,11 @@
-from typing import Union, Literal, Self
+from typing import Union, Literal, Self, NamedTuple
 import re
-from dataclasses import dataclass
+import sys
 
 Instruction = Union[int, Literal['L', 'R']]
 Tile = Literal[' ', '.', '#']
 
-@dataclass
-class Point:
+class Point(NamedTuple):
     x: int
     y: int
 
@@ -16,25 +15,33 @@ class Point:
 DIRECTIONS = [Point(1, 0), Point(0, 1), Point(-1, 0), Point(0, -1)]
 
 class Board:
-    board_map: list[list[Tile]]
+    cells: bytearray
+    width: int
+    height: int
+    stride: int
 
     def __init__(self, board_map: list[list[Tile]]):
-        self.board_map = board_map
+        self.width = max(len(row) for row in board_map)
+        self.height = len(board_map)
+        self.stride = self.width + 2
 
-    def start_position(self) -> Point:
-        y = 0
-        x = self.board_map[y].index('.')
-        return Point(x, y)
+        # Pad with empty space so stepping off the edge needs no bounds checks
+        self.cells = bytearray(b' ') * (self.stride * (self.height + 2))
 
-    def get_tile_at(self, point: Point) -> Tile:
-        if point.y < 0 or point.y >= len(self.board_map):
-            return ' '
+        for y, row in enumerate(board_map):
+            start = self.index(Point(0, y))
+            self.cells[start:start + len(row)] = ''.join(row).encode('ascii')
 
-        if point.x < 0 or point.x >= len(self.board_map[point.y]):
-            return ' '
+    def index(self, point: Point) -> int:
+        return (point.y + 1) * self.stride + point.x + 1
 
-        return self.board_map[point.y][point.x]
+    def start_position(self) -> Point:
+        start = self.index(Point(0, 0))
+        x = self.cells.index(b'.', start) - start
+        return Point(x, 0)
 
+    def get_tile_at(self, point: Point) -> Tile:
+        return chr(self.cells[self.index(point)])
 
     def next_tile_position(self, position: Point, direction: Point) -> Point:
         next_tile_pos = position + direction
@@ -83,8 +90,8 @@ class Player:
         return True
 
 
-def main():
-    board, instructions = parse_input()
+def main(input_path: str = '22/input.txt'):
+    board, instructions = parse_input(input_path)
     player = Player(board)
 
     for instruction in instructions:
@@ -97,8 +104,8 @@ def main():
     print('Password:', password)
 
 
-def parse_input() -> tuple[Board, list[Instruction]]:
-    with open('22/input.txt', encoding='ascii') as file:
+def parse_input(input_path: str) -> tuple[Board, list[Instruction]]:
+    with open(input_path, encoding='ascii') as file:
         lines = [line.rstrip() for line in file]
 
     board_map = [parse_board_line(line) for line in lines[:-2]]
@@ -128,4 +135,4 @@ def parse_instruction(instruction: str) -> Instruction:
 
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
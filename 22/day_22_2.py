@@ -1,10 +1,9 @@
-from typing import Union, Literal, Self
+from typing import Union, Literal, Self, NamedTuple
 import re
-from dataclasses import dataclass
 from enum import StrEnum, IntEnum
+import sys
 
-@dataclass(frozen=True)
-class Point:
+class Point(NamedTuple):
     x: int
     y: int
 
@@ -75,24 +74,37 @@ FACE_POSITIONS = {
 }
 
 class Board:
-    board_map: list[list[Tile]]
+    cells: bytearray
+    width: int
+    height: int
+    stride: int
 
     def __init__(self, board_map: list[list[Tile]]):
-        self.board_map = board_map
+        self.width = max(len(row) for row in board_map)
+        self.height = len(board_map)
+        self.stride = self.width + 2
+
+        # Pad with empty space so stepping off the edge needs no bounds checks
+        self.cells = bytearray(b' ') * (self.stride * (self.height + 2))
+
+        for y, row in enumerate(board_map):
+            start = self.index(Point(0, y))
+            self.cells[start:start + len(row)] = ''.join(row).encode('ascii')
+
+    def index(self, point: Point) -> int:
+        return (point.y + 1) * self.stride + point.x + 1
 
     def start_position(self) -> Point:
-        y = 0
-        x = self.board_map[y].index('.')
-        return Point(x, y)
+        start = self.index(Point(0, 0))
+        x = self.cells.index(b'.', start) - start
+        return Point(x, 0)
 
     def get_tile_at(self, point: Point) -> Tile:
-        if point.y < 0 or point.y >= len(self.board_map):
-            return ' '
-
-        if point.x < 0 or point.x >= len(self.board_map[point.y]):
+        # Wrapping around the cube can land further off the board than the padding
+        if not (-1 <= point.x <= self.width and -1 <= point.y <= self.height):
             return ' '
 
-        return self.board_map[point.y][point.x]
+        return chr(self.cells[self.index(point)])
 
     def get_cube_face_at(self, point: Point) -> CubeFace:
         for face, face_position in FACE_POSITIONS.items():
@@ -181,8 +193,8 @@ class Player:
         return True
 
 
-def main():
-    board, instructions = parse_input()
+def main(input_path: str = '22/input.txt'):
+    board, instructions = parse_input(input_path)
     player = Player(board)
 
     for instruction in instructions:
@@ -195,8 +207,8 @@ def main():
     print('Password:', password)
 
 
-def parse_input() -> tuple[Board, list[Instruction]]:
-    with open('22/input.txt', encoding='ascii') as file:
+def parse_input(input_path: str) -> tuple[Board, list[Instruction]]:
+    with open(input_path, encoding='ascii') as file:
         lines = [line.rstrip() for line in file]
 
     board_map = [parse_board_line(line) for line in lines[:-2]]
@@ -226,4 +238,4 @@ def parse_instruction(instruction: str) -> Instruction:
 
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
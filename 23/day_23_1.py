@@ -1,9 +1,8 @@
-from dataclasses import dataclass
 from collections import defaultdict
-from typing import Self
+from typing import Self, NamedTuple
+import sys
 
-@dataclass(frozen=True)
-class Point:
+class Point(NamedTuple):
     x: int
     y: int
 
@@ -17,8 +16,10 @@ DIRECTION_CHECKS = [
     (Point(1, 0),  [Point(1, -1), Point(1, 0), Point(1, 1)]),
 ]
 
-def main():
-    elf_positions = read_elf_positions()
+NEIGHBOURS = [Point(x, y) for y in range(-1, 2) for x in range(-1, 2) if x != 0 or y != 0]
+
+def main(input_path: str = '23/input.txt'):
+    elf_positions = read_elf_positions(input_path)
 
     for round in range(10):
         elf_positions = do_round(elf_positions, round)
@@ -82,15 +83,9 @@ def propose_position(current_position: Point, elf_positions: set[Point], round:
 
 
 def has_elf_neighbour(current_position: Point, elf_positions: set[Point]) -> bool:
-    for y in range(-1, 2):
-        for x in range(-1, 2):
-            if y == 0 and x == 0:
-                continue
-
-            check_position = Point(current_position.x + x, current_position.y + y)
-
-            if check_position in elf_positions:
-                return True
+    for neighbour in NEIGHBOURS:
+        if current_position + neighbour in elf_positions:
+            return True
 
     return False
 
@@ -122,10 +117,10 @@ def count_empty_spaces(elf_positions: set[Point]):
     return total_spaces - occupied_spaces
 
 
-def read_elf_positions() -> set[Point]:
+def read_elf_positions(input_path: str) -> set[Point]:
     elf_positions: set[Point] = set()
 
-    with open('23/input.txt', encoding='ascii') as file:
+    with open(input_path, encoding='ascii') as file:
         for y, line in enumerate(file):
             for x, char in enumerate(line):
                 if char == '#':
@@ -134,4 +129,4 @@ def read_elf_positions() -> set[Point]:
     return elf_positions
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
-from typing import Self
+from typing import Self, NamedTuple
 from enum import StrEnum
+import sys
 
 class Direction(StrEnum):
     NORTH = '^'
@@ -8,8 +9,7 @@ class Direction(StrEnum):
     SOUTH = 'v'
     WEST = '<'
 
-@dataclass(frozen=True)
-class Point:
+class Point(NamedTuple):
     x: int
     y: int
 
@@ -35,11 +35,15 @@ class Blizzard:
             (self.position.y + DIRECTIONS[self.direction].y) % height
         )
 
+OPEN = 0
+BLOCKED = 1
+
 class Valley:
     width: int
     height: int
     entrance_position: Point
     exit_position: Point
+    offsets: tuple[int, ...]
     blizzards: list[Blizzard]
 
     def __init__(self, width: int, height: int):
@@ -47,6 +51,8 @@ class Valley:
         self.height = height
         self.entrance_position = Point(0, -1)
         self.exit_position = Point(width - 1, height)
+        # Waiting in place, then moving north, east, south and west
+        self.offsets = (0, -(width + 2), 1, width + 2, -1)
         self.blizzards = []
 
     def add_blizzard(self, position: Point, direction: Direction):
@@ -56,8 +62,27 @@ class Valley:
         for blizzard in self.blizzards:
             blizzard.move(self.width, self.height)
 
-    def get_blizard_positions(self) -> set[Point]:
-        return {b.position for b in self.blizzards}
+    def index(self, point: Point) -> int:
+        return (point.y + 2) * (self.width + 2) + point.x + 1
+
+    def get_blocked_cells(self) -> bytearray:
+        # Walls are blocked, with an extra row of wall above the entrance and
+        # below the exit so every neighbour lookup stays inside the grid
+        stride = self.width + 2
+        cells = bytearray([BLOCKED]) * (stride * (self.height + 4))
+        open_row = bytes([BLOCKED]) + bytes([OPEN]) * self.width + bytes([BLOCKED])
+
+        for y in range(self.height):
+            start = self.index(Point(-1, y))
+            cells[start:start + stride] = open_row
+
+        cells[self.index(self.entrance_position)] = OPEN
+        cells[self.index(self.exit_position)] = OPEN
+
+        for blizzard in self.blizzards:
+            cells[self.index(blizzard.position)] = BLOCKED
+
+        return cells
 
     def __str__(self):
         output = ''
@@ -89,71 +114,38 @@ class Valley:
 
         return output
 
-@dataclass(frozen=True)
-class State:
-    time: int
-    position: Point
-
-def main():
-    valley = read_valley()
-
-    blizzard_positions_at_time: dict[int, set[Point]] = {}
-
-    initial_state = State(0, valley.entrance_position)
+def main(input_path: str = '24/input.txt'):
+    valley = read_valley(input_path)
 
-    queue = [initial_state]
-    dist = {initial_state: 0}
+    # Every move takes one minute, so each frontier holds all the positions
+    # reachable at the same time and only needs that minute's blizzards
+    time = 0
+    positions = {valley.index(valley.entrance_position)}
+    exit_index = valley.index(valley.exit_position)
 
-    while queue:
-        state = queue.pop(0)
-        # print('State:', state)
-
-        if state.position == valley.exit_position:
-            print('Dist:', dist[state])
+    while positions:
+        if exit_index in positions:
+            print('Dist:', time)
             return
 
-        if (state.time + 1) not in blizzard_positions_at_time:
-            valley.move_blizzards()
-            blizzard_positions_at_time[state.time + 1] = valley.get_blizard_positions()
-            # print(valley)
-
-        blizzard_positions = blizzard_positions_at_time[state.time + 1]
-
-        neighbours = get_neighbours(state, blizzard_positions, valley)
-        # print(neighbours)
-
-        for neighbour in neighbours:
-            if neighbour not in dist:
-                queue.append(neighbour)
-                dist[neighbour] = dist[state] + 1
-
-
-def get_neighbours(state: State, blizzard_positions: set[Point], valley: Valley):
-    neighbours: list[State] = []
-
-    for direction in DIRECTIONS.values():
-        new_position = state.position + direction
-
-        if new_position.x < 0 or new_position.x >= valley.width:
-            continue
-
-        if (new_position.y < 0 or new_position.y >= valley.height) and (new_position != valley.exit_position):
-            continue
-
-        if new_position in blizzard_positions:
-            continue
+        valley.move_blizzards()
+        blocked_cells = valley.get_blocked_cells()
+        time += 1
 
-        neighbours.append(State(state.time + 1, new_position))
+        positions = {
+            neighbour
+            for position in positions
+            for neighbour in get_neighbours(position, blocked_cells, valley)
+        }
 
-    if state.position not in blizzard_positions:
-        neighbours.append(State(state.time + 1, state.position))
 
-    return neighbours
+def get_neighbours(position: int, blocked_cells: bytearray, valley: Valley) -> list[int]:
+    return [position + offset for offset in valley.offsets if not blocked_cells[position + offset]]
 
 
 
-def read_valley():
-    with open('24/input.txt', encoding='ascii') as file:
+def read_valley(input_path: str):
+    with open(input_path, encoding='ascii') as file:
         lines = [line.strip() for line in file]
 
     width = len(lines[0]) - 2
@@ -172,4 +164,4 @@ def read_valley():
 
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
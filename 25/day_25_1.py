@@ -1,9 +1,10 @@
+import sys
 
 SNAFU_CHARACTERS = {'=': -2, '-': -1, '0': 0, '1': 1, '2': 2}
 SNAFU_DIGITS = {x: y for (y, x) in SNAFU_CHARACTERS.items()}
 
-def main():
-    snafu_fuel_requirements = read_fuel_requirements()
+def main(input_path: str = '25/input.txt'):
+    snafu_fuel_requirements = read_fuel_requirements(input_path)
     decimal_fuel_requirements = list(map(snafu_to_decimal, snafu_fuel_requirements))
 
     total_fuel_requirements = sum(decimal_fuel_requirements)
@@ -35,9 +36,9 @@ def decimal_to_snafu(decimal: int) -> str:
     return ''.join(snafu)
 
 
-def read_fuel_requirements() -> list[str]:
-    with open('25/input.txt', encoding='ascii') as file:
+def read_fuel_requirements(input_path: str) -> list[str]:
+    with open(input_path, encoding='ascii') as file:
         return [line.strip() for line in file]
 
 if __name__ == '__main__':
-    main()
+    main(*sys.argv[1:])
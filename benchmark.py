@@ -0,0 +1,724 @@
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from pathlib import Path
+import argparse
+import contextlib
+import cProfile
+import importlib.util
+import inspect
+import io
+import json
+import math
+import os
+import pstats
+import re
+import resource
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import generate
+
+ROOT = Path(__file__).resolve().parent
+SCRIPT_PATTERN = re.compile(r'(\d{2})/day_\1_(\d)\.py')
+HISTORY_PATH = ROOT / '.benchmarks' / 'history.jsonl'
+CACHE_PATH = ROOT / '.benchmarks' / 'answers.json'
+PROFILE_PATH = ROOT / '.benchmarks' / 'profiles'
+
+# Ignore timing changes on days too fast to measure reliably
+MIN_COMPARE_TIME = 0.05
+
+# How much traced memory must grow before another allocation snapshot
+SNAPSHOT_GROWTH = 1.125
+
+
+@dataclass
+class Result:
+    script: str
+    answer: str
+    output: str
+    wall_times: list[float]
+    cpu_times: list[float]
+    peak_rss_kb: int
+    error: str | None = None
+    cached: bool = False
+
+    @property
+    def wall_time(self) -> float:
+        return statistics.median(self.wall_times) if self.wall_times else 0.0
+
+    @property
+    def cpu_time(self) -> float:
+        return statistics.median(self.cpu_times) if self.cpu_times else 0.0
+
+    def to_json(self):
+        return {**asdict(self), 'wall_time': self.wall_time, 'cpu_time': self.cpu_time}
+
+
+def main():
+    args = parse_args()
+    scripts = find_scripts(args.scripts)
+
+    if not scripts:
+        sys.exit('No matching scripts found')
+
+    if args.profile:
+        profile_scripts(scripts, args.input, args.top)
+        return
+
+    if args.sweep:
+        sweep_results = run_sweep(scripts, args.sweep, args.repeat, args.seed, args.jobs)
+        print(format_sweep_table(sweep_results, args.sweep))
+
+        if args.json:
+            write_json(sweep_results, args.json)
+        return
+
+    cache = AnswerCache.load(CACHE_PATH, args.cache_size) if args.cache else None
+    results = run_scripts(scripts, args.repeat, args.input, args.jobs, cache)
+
+    if cache:
+        cache.save()
+
+    if args.json != '-':
+        print(format_table(results))
+
+    if args.json:
+        write_json(results, args.json)
+
+    if args.save:
+        save_history(results, args.repeat)
+
+    if args.compare is not None:
+        regressions = compare_history(results, args.compare or None, args.threshold)
+
+        if regressions:
+            sys.exit(1)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Time the main() of every NN/day_NN_P.py script')
+    parser.add_argument('scripts', nargs='*', help='days (e.g. 16) or parts (e.g. 16_2) to run, defaults to all')
+    parser.add_argument('-r', '--repeat', type=int, default=1, help='number of times to run each main()')
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help='number of scripts to run in parallel, timings are less reliable with more than one'
+    )
+    parser.add_argument(
+        '-i', '--input', metavar='PATH',
+        help="input file passed to each main(), '{day}' is replaced with the day directory (e.g. '{day}/test.txt')"
+    )
+    parser.add_argument(
+        '--sweep', metavar='SIZES', type=parse_sizes,
+        help='time each script on generated inputs of these comma separated sizes and fit a growth curve'
+    )
+    parser.add_argument(
+        '--cache', action='store_true',
+        help='reuse the results of scripts whose source and input are unchanged since they were last run'
+    )
+    parser.add_argument('--cache-size', type=int, default=256, help='most results to keep in the cache (default 256)')
+    parser.add_argument(
+        '--profile', action='store_true',
+        help=f'write cProfile stats, collapsed stacks and an allocation report for each script to {PROFILE_PATH.relative_to(ROOT)}'
+    )
+    parser.add_argument('--top', type=int, default=20, help='number of functions and allocation sites to report when profiling')
+    parser.add_argument('--seed', type=int, default=0, help='random seed for generated inputs')
+    parser.add_argument('--json', metavar='PATH', help="write results as JSON to PATH ('-' for stdout)")
+    parser.add_argument('--save', action='store_true', help='record results against the current commit in the history')
+    parser.add_argument(
+        '--compare', metavar='REF', nargs='?', const='',
+        help='compare results with those recorded for REF, defaults to the most recent other commit'
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=0.1,
+        help='fractional increase in median time or peak RSS counted as a regression (default 0.1)'
+    )
+    return parser.parse_args()
+
+
+def parse_sizes(sizes: str) -> list[int]:
+    return [int(size) for size in sizes.split(',')]
+
+
+def find_scripts(selectors: list[str]) -> list[str]:
+    scripts: list[str] = []
+
+    for path in sorted(ROOT.glob('[0-9][0-9]/day_*_[0-9].py')):
+        script = path.relative_to(ROOT).as_posix()
+        match = SCRIPT_PATTERN.fullmatch(script)
+
+        if not match:
+            continue
+
+        day, part = map(int, match.groups())
+
+        if selectors and not any(is_selected(s, day, part) for s in selectors):
+            continue
+
+        scripts.append(script)
+
+    return scripts
+
+
+def is_selected(selector: str, day: int, part: int) -> bool:
+    match = re.fullmatch(r'(\d+)(?:_(\d))?', selector)
+
+    if not match:
+        raise ValueError(f'Invalid script selector: {selector}')
+
+    return int(match.group(1)) == day and (match.group(2) is None or int(match.group(2)) == part)
+
+
+def run_scripts(
+    scripts: list[str],
+    repeat: int,
+    input_path: str | None = None,
+    jobs: int = 1,
+    cache: 'AnswerCache | None' = None
+) -> list[Result]:
+    results: dict[str, Result] = {}
+    keys: dict[str, str | None] = {}
+    start = time.perf_counter()
+
+    if cache:
+        for script in scripts:
+            keys[script] = get_cache_key(script, repeat, input_path)
+            cached_result = cache.get(keys[script])
+
+            if cached_result:
+                results[script] = cached_result
+                print(f'Cached {script}', file=sys.stderr)
+
+    # Start the slowest scripts first so they don't hold up the end of the run
+    expected_times = get_expected_times()
+    to_run = [script for script in scripts if script not in results]
+    order = sorted(to_run, key=lambda script: expected_times.get(script, math.inf), reverse=True)
+
+    # A fresh process per script keeps module state and peak RSS separate
+    with ProcessPoolExecutor(max_workers=jobs, max_tasks_per_child=1) as executor:
+        futures = {executor.submit(run_script, script, repeat, input_path): script for script in order}
+
+        for future in as_completed(futures):
+            result = future.result()
+            results[result.script] = result
+            print(f'Finished {result.script} in {sum(result.wall_times):.3f}s', file=sys.stderr)
+
+            if cache and not result.error:
+                cache.put(keys[result.script], result)
+
+    print(f'Ran {len(to_run)} scripts in {time.perf_counter() - start:.3f}s', file=sys.stderr)
+
+    return [results[script] for script in scripts]
+
+
+def get_expected_times() -> dict[str, float]:
+    # Later records replace earlier ones, scripts never timed are missing
+    return {record['script']: record['wall_time'] * record['repeat'] for record in load_history()}
+
+
+def run_script(script: str, repeat: int, input_path: str | None = None) -> Result:
+    os.chdir(ROOT)
+
+    output = ''
+    wall_times: list[float] = []
+    cpu_times: list[float] = []
+    error = None
+
+    try:
+        for _ in range(repeat):
+            # Reload for each run as some days mutate module level state
+            module = load_module(script)
+            main_args = get_main_args(module.main, script, input_path)
+            buffer = io.StringIO()
+
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+
+            with contextlib.redirect_stdout(buffer):
+                module.main(*main_args)
+
+            cpu_times.append(time.process_time() - cpu_start)
+            wall_times.append(time.perf_counter() - wall_start)
+            output = buffer.getvalue()
+    except Exception as exception: # pylint: disable=broad-exception-caught
+        error = f'{type(exception).__name__}: {exception}'
+
+    return Result(
+        script=script,
+        answer=get_answer(output),
+        output=output,
+        wall_times=wall_times,
+        cpu_times=cpu_times,
+        peak_rss_kb=get_peak_rss_kb(),
+        error=error
+    )
+
+
+def get_peak_rss_kb() -> int:
+    # Setting max_tasks_per_child makes the pool spawn its workers, a fork
+    # followed by an exec. ru_maxrss keeps the high water mark of the forked
+    # copy of the runner through the exec, while VmHWM starts again from the
+    # new image. ru_maxrss is only a fallback for systems without /proc.
+    try:
+        with open('/proc/self/status', encoding='ascii') as file:
+            for line in file:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def get_main_args(day_main, script: str, input_path: str | None = None) -> list[str]:
+    # Days without an input file have a main that takes no arguments
+    if not input_path or not inspect.signature(day_main).parameters:
+        return []
+
+    return [input_path.format(day=Path(script).parent)]
+
+
+def get_input_file(script: str, input_path: str | None = None) -> Path:
+    day = Path(script).parent
+    return ROOT / (input_path.format(day=day) if input_path else day / 'input.txt')
+
+
+def load_module(script: str):
+    name = Path(script).stem
+    spec = importlib.util.spec_from_file_location(name, ROOT / script)
+    module = importlib.util.module_from_spec(spec)
+
+    # Registered so days that use a process pool can pickle their functions
+    sys.modules[name] = module
+
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_answer(output: str) -> str:
+    lines = [line.strip() for line in output.splitlines() if line.strip()]
+    return lines[-1] if lines else ''
+
+
+def format_table(results: list[Result]) -> str:
+    headers = ('Script', 'Wall (s)', 'CPU (s)', 'Peak RSS (MB)', 'Answer')
+    rows = [
+        (
+            r.script,
+            f'{r.wall_time:.3f}' + (' (cached)' if r.cached else ''),
+            f'{r.cpu_time:.3f}',
+            f'{r.peak_rss_kb / 1024:.1f}',
+            r.error or r.answer
+        )
+        for r in results
+    ]
+
+    return format_rows(headers, rows)
+
+
+def format_rows(headers: tuple[str, ...], rows: list[tuple[str, ...]]) -> str:
+    widths = [max(len(row[i]) for row in [headers, *rows]) for i in range(len(headers))]
+    lines = ['  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in [headers, *rows]]
+    lines.insert(1, '  '.join('-' * width for width in widths))
+
+    return '\n'.join(lines)
+
+
+def write_json(results: list, path: str):
+    data = json.dumps([r.to_json() for r in results], indent=2)
+
+    if path == '-':
+        print(data)
+    else:
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(data + '\n')
+
+
+@dataclass
+class SweepResult:
+    script: str
+    sizes: list[int]
+    wall_times: list[float | None]
+
+    @property
+    def exponent(self) -> float | None:
+        # Least squares fit of time = c * size ^ k on a log-log scale
+        points = [(math.log(n), math.log(t)) for n, t in zip(self.sizes, self.wall_times) if t]
+
+        if len(points) < 2:
+            return None
+
+        mean_x = statistics.fmean(x for x, _ in points)
+        mean_y = statistics.fmean(y for _, y in points)
+        variance = sum((x - mean_x) ** 2 for x, _ in points)
+
+        if not variance:
+            return None
+
+        return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+    def to_json(self):
+        return {**asdict(self), 'exponent': self.exponent}
+
+
+def run_sweep(scripts: list[str], sizes: list[int], repeat: int, seed: int, jobs: int = 1) -> list[SweepResult]:
+    scripts = [s for s in scripts if int(Path(s).parent.name) in generate.GENERATORS]
+    sweep_results = [SweepResult(script, sizes, []) for script in scripts]
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            input_template = str(Path(directory) / f'{{day}}_{size}.txt')
+
+            for day in {Path(s).parent.name for s in scripts}:
+                with open(input_template.format(day=day), 'w', encoding='ascii') as file:
+                    file.write(generate.generate(int(day), size, seed))
+
+            print(f'Size {size}:', file=sys.stderr)
+            results = run_scripts(scripts, repeat, input_template, jobs)
+
+            for sweep_result, result in zip(sweep_results, results):
+                sweep_result.wall_times.append(None if result.error else result.wall_time)
+
+    return sweep_results
+
+
+def format_sweep_table(sweep_results: list[SweepResult], sizes: list[int]) -> str:
+    headers = ('Script', *(f'n={size}' for size in sizes), 'Growth')
+    rows = [
+        (
+            r.script,
+            *('error' if t is None else f'{t:.3f}' for t in r.wall_times),
+            '?' if r.exponent is None else f'n^{r.exponent:.2f}'
+        )
+        for r in sweep_results
+    ]
+
+    return format_rows(headers, rows)
+
+
+# Results of earlier runs keyed by script, source and input, least recently used first
+class AnswerCache:
+    path: Path
+    max_entries: int
+    entries: OrderedDict[str, dict]
+
+    def __init__(self, path: Path, max_entries: int, entries: OrderedDict[str, dict] | None = None):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = entries or OrderedDict()
+
+    @classmethod
+    def load(cls, path: Path, max_entries: int) -> 'AnswerCache':
+        if not path.exists():
+            return cls(path, max_entries)
+
+        with open(path, encoding='utf-8') as file:
+            return cls(path, max_entries, OrderedDict(json.load(file)))
+
+    def get(self, key: str | None) -> Result | None:
+        if key not in self.entries:
+            return None
+
+        self.entries.move_to_end(key)
+        return Result(**self.entries[key], cached=True)
+
+    def put(self, key: str | None, result: Result):
+        if key is None:
+            return
+
+        self.entries[key] = {
+            field: value for field, value in asdict(result).items() if field not in ('error', 'cached')
+        }
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def save(self):
+        self.path.parent.mkdir(exist_ok=True)
+
+        with open(self.path, 'w', encoding='utf-8') as file:
+            json.dump(self.entries, file)
+
+
+def get_cache_key(script: str, repeat: int, input_path: str | None = None) -> str | None:
+    # Spawned workers import this module again as __mp_main__, so importing
+    # hashlib here keeps OpenSSL's 4MB or so out of their peak RSS
+    import hashlib # pylint: disable=import-outside-toplevel
+
+    source_hash = hashlib.sha256((ROOT / script).read_bytes()).hexdigest()
+    input_file = get_input_file(script, input_path)
+
+    if input_file.exists():
+        input_hash = hashlib.sha256(input_file.read_bytes()).hexdigest()
+    elif input_path:
+        # Leave a missing input for the script to report
+        return None
+    else:
+        # Days without an input file depend only on their source
+        input_hash = ''
+
+    # Cached timings are only comparable across runs with the same --repeat
+    return f'{script}:{repeat}:{source_hash}:{input_hash}'
+
+
+def profile_scripts(scripts: list[str], input_path: str | None, top: int):
+    PROFILE_PATH.mkdir(parents=True, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+        for script in scripts:
+            print(f'Profiling {script}...', file=sys.stderr)
+
+            # Carry on with the other scripts so one failure doesn't lose them
+            try:
+                print(executor.submit(profile_script, script, input_path, top).result())
+            except Exception as exception: # pylint: disable=broad-exception-caught
+                print(f'Failed {script}: {type(exception).__name__}: {exception}', file=sys.stderr)
+
+
+def profile_script(script: str, input_path: str | None, top: int) -> str:
+    os.chdir(ROOT)
+
+    name = script.replace('/', '_').removesuffix('.py')
+
+    stats_path = PROFILE_PATH / f'{name}.prof'
+    stacks_path = PROFILE_PATH / f'{name}.collapsed'
+    allocations_path = PROFILE_PATH / f'{name}.allocations.txt'
+
+    # Each profiler gets a run of its own so none of them shows up in or
+    # slows down what the others measure
+    day_main = load_module(script).main
+    main_args = get_main_args(day_main, script, input_path)
+    profiler = cProfile.Profile()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        profiler.runcall(day_main, *main_args)
+
+    profiler.dump_stats(stats_path)
+
+    day_main = load_module(script).main
+    sampler = StackSampler()
+
+    with contextlib.redirect_stdout(io.StringIO()), sampler:
+        day_main(*main_args)
+
+    sampler.write(stacks_path)
+
+    day_main = load_module(script).main
+    tracer = AllocationTracer()
+
+    with contextlib.redirect_stdout(io.StringIO()), tracer:
+        day_main(*main_args)
+
+    tracer.write(allocations_path, top)
+
+    report = io.StringIO()
+    report.write(f'{script}\n')
+    pstats.Stats(profiler, stream=report).strip_dirs().sort_stats('tottime').print_stats(top)
+    report.write(f'Stats: {stats_path.relative_to(ROOT)}\n')
+    report.write(f'Collapsed stacks: {stacks_path.relative_to(ROOT)}\n')
+    report.write(f'Allocations: {allocations_path.relative_to(ROOT)}\n')
+
+    return report.getvalue()
+
+
+# Counts the call stacks seen on a CPU time timer, written one per line as
+# 'outer;inner count' for flamegraph.pl or speedscope
+class StackSampler:
+    interval: float
+    stacks: Counter[str]
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.stacks = Counter()
+
+    def __enter__(self):
+        signal.signal(signal.SIGPROF, self.sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *exc_info):
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, signal.SIG_DFL)
+
+    def sample(self, _signum, frame):
+        stack: list[str] = []
+
+        # Stop at the runner's frames so only the script's calls are counted
+        while frame and frame.f_code.co_filename != __file__:
+            code = frame.f_code
+            stack.append(f'{os.path.basename(code.co_filename)}:{code.co_name}')
+            frame = frame.f_back
+
+        if stack:
+            self.stacks[';'.join(reversed(stack))] += 1
+
+    def write(self, path: Path):
+        with open(path, 'w', encoding='utf-8') as file:
+            for stack, count in self.stacks.most_common():
+                file.write(f'{stack} {count}\n')
+
+
+# Keeps a tracemalloc snapshot from near the point of highest traced memory,
+# as most of what a script allocates is freed by the time main() returns
+class AllocationTracer:
+    interval: float
+    snapshot: tracemalloc.Snapshot | None
+    snapshot_size: int
+    peak_size: int
+
+    def __init__(self, interval: float = 0.1):
+        self.interval = interval
+        self.snapshot = None
+        self.snapshot_size = 0
+        self.peak_size = 0
+
+    def __enter__(self):
+        tracemalloc.start()
+        signal.signal(signal.SIGPROF, self.check)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        sys.setprofile(self.trace)
+        return self
+
+    def __exit__(self, *exc_info):
+        sys.setprofile(None)
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, signal.SIG_DFL)
+        self.check()
+        self.peak_size = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    def trace(self, _frame, event: str, _arg):
+        # Scripts too quick for the timer still pass their peak on the way
+        # out of some function
+        if event in ('return', 'c_return'):
+            self.check()
+
+    def check(self, *_args):
+        size = tracemalloc.get_traced_memory()[0]
+
+        # Only snapshot once memory has grown by an eighth since the last
+        # one, so a slowly growing script takes few snapshots
+        if size > self.snapshot_size * SNAPSHOT_GROWTH:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = size
+
+    def write(self, path: Path, top: int):
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(f'Peak traced memory: {self.peak_size / 1024 / 1024:.1f}MB\n')
+            file.write(f'Snapshot of {self.snapshot_size / 1024 / 1024:.1f}MB:\n')
+
+            if self.snapshot:
+                for statistic in self.snapshot.statistics('lineno')[:top]:
+                    file.write(f'  {statistic}\n')
+
+
+def git(*args: str) -> str:
+    result = subprocess.run(['git', *args], cwd=ROOT, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def save_history(results: list[Result], repeat: int):
+    commit = git('rev-parse', 'HEAD')
+    dirty = bool(git('status', '--porcelain', '--untracked-files=no'))
+    timestamp = time.time()
+
+    HISTORY_PATH.parent.mkdir(exist_ok=True)
+
+    with open(HISTORY_PATH, 'a', encoding='utf-8') as file:
+        for result in results:
+            # Cached results were timed against whichever commit first ran them
+            if result.error or result.cached:
+                continue
+
+            record = {
+                'commit': commit,
+                'dirty': dirty,
+                'timestamp': timestamp,
+                'script': result.script,
+                'repeat': repeat,
+                'wall_time': result.wall_time,
+                'cpu_time': result.cpu_time,
+                'peak_rss_kb': result.peak_rss_kb,
+                'answer': result.answer
+            }
+            file.write(json.dumps(record) + '\n')
+
+
+def load_history() -> list[dict]:
+    if not HISTORY_PATH.exists():
+        return []
+
+    with open(HISTORY_PATH, encoding='utf-8') as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def compare_history(results: list[Result], ref: str | None, threshold: float) -> list[str]:
+    history = load_history()
+    head = git('rev-parse', 'HEAD')
+
+    if ref:
+        base = git('rev-parse', ref)
+    else:
+        other_commits = [record['commit'] for record in history if record['commit'] != head]
+        if not other_commits:
+            sys.exit('No recorded results for another commit to compare with')
+        base = other_commits[-1]
+
+    # Later records for the same commit replace earlier ones
+    baseline = {record['script']: record for record in history if record['commit'] == base}
+
+    if not baseline:
+        sys.exit(f'No recorded results for {base[:10]}')
+
+    print()
+    print(f'Compared with {base[:10]} (threshold {threshold:.0%}):')
+
+    regressions: list[str] = []
+
+    for result in results:
+        record = baseline.get(result.script)
+
+        if result.error or not record:
+            continue
+
+        changes = compare_result(result, record, threshold)
+
+        if changes:
+            regressions.append(result.script)
+            print(f'  REGRESSION {result.script}: {", ".join(changes)}')
+
+    if not regressions:
+        print('  No regressions')
+
+    return regressions
+
+
+def compare_result(result: Result, record: dict, threshold: float) -> list[str]:
+    changes: list[str] = []
+
+    old_time = record['wall_time']
+    new_time = result.wall_time
+
+    if new_time >= MIN_COMPARE_TIME and new_time > old_time * (1 + threshold):
+        changes.append(f'time {old_time:.3f}s -> {new_time:.3f}s')
+
+    old_rss = record['peak_rss_kb']
+    new_rss = result.peak_rss_kb
+
+    if new_rss > old_rss * (1 + threshold):
+        changes.append(f'peak RSS {old_rss / 1024:.1f}MB -> {new_rss / 1024:.1f}MB')
+
+    if result.answer != record['answer']:
+        changes.append(f'answer {record["answer"]!r} -> {result.answer!r}')
+
+    return changes
+
+
+if __name__ == '__main__':
+    main()
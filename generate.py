@@ -0,0 +1,464 @@
+from typing import Callable
+import argparse
+import random
+import string
+import sys
+
+Generator = Callable[[int, random.Random], str]
+
+GENERATORS: dict[int, Generator] = {}
+
+
+def generator(day: int):
+    def register(func: Generator) -> Generator:
+        GENERATORS[day] = func
+        return func
+    return register
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic puzzle input for a day')
+    parser.add_argument('day', type=int, choices=sorted(GENERATORS))
+    parser.add_argument('size', type=int, help="scale of the input, see each generator for what it counts")
+    parser.add_argument('-s', '--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', metavar='PATH', help='file to write to, defaults to stdout')
+    args = parser.parse_args()
+
+    data = generate(args.day, args.size, args.seed)
+
+    if args.output:
+        with open(args.output, 'w', encoding='ascii') as file:
+            file.write(data)
+    else:
+        sys.stdout.write(data)
+
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    return GENERATORS[day](size, random.Random(seed))
+
+
+@generator(1)
+def generate_day_01(elves: int, rng: random.Random) -> str:
+    return '\n\n'.join(
+        '\n'.join(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15)))
+        for _ in range(elves)
+    )
+
+
+@generator(2)
+def generate_day_02(rounds: int, rng: random.Random) -> str:
+    return '\n'.join(f'{rng.choice("ABC")} {rng.choice("XYZ")}' for _ in range(rounds))
+
+
+@generator(3)
+def generate_day_03(rucksacks: int, rng: random.Random) -> str:
+    lines: list[str] = []
+
+    for _ in range(max(1, rucksacks // 3)):
+        items = list(string.ascii_letters)
+        rng.shuffle(items)
+        badge = items.pop()
+
+        # Each elf in the group draws from its own pool so only the badge is common to all three
+        for elf in range(3):
+            pool = items[elf * 17:(elf + 1) * 17]
+            shared = pool[0]
+            first_items = pool[1:9]
+            second_items = pool[9:]
+
+            count = rng.randint(4, 16)
+            first = [shared, badge] + rng.choices(first_items, k=count - 2)
+            second = [shared] + rng.choices(second_items, k=count - 1)
+            rng.shuffle(first)
+            rng.shuffle(second)
+
+            lines.append(''.join(first + second))
+
+    return '\n'.join(lines)
+
+
+@generator(4)
+def generate_day_04(pairs: int, rng: random.Random) -> str:
+    lines: list[str] = []
+
+    for _ in range(pairs):
+        a, b = sorted(rng.randint(1, 99) for _ in range(2))
+        c, d = sorted(rng.randint(1, 99) for _ in range(2))
+        lines.append(f'{a}-{b},{c}-{d}')
+
+    return '\n'.join(lines)
+
+
+@generator(5)
+def generate_day_05(steps: int, rng: random.Random) -> str:
+    stack_count = 9
+    height = max(4, int(steps ** 0.5))
+    stacks = [rng.choices(string.ascii_uppercase, k=rng.randint(2, height)) for _ in range(stack_count)]
+
+    diagram: list[str] = []
+
+    for level in range(max(len(s) for s in stacks) - 1, -1, -1):
+        diagram.append(' '.join(f'[{s[level]}]' if level < len(s) else '   ' for s in stacks))
+
+    diagram.append(' '.join(f' {i + 1} ' for i in range(stack_count)))
+
+    procedure: list[str] = []
+    heights = [len(s) for s in stacks]
+
+    for _ in range(steps):
+        # Never empty a stack so every stack still has a top crate at the end
+        from_stack = rng.choice([i for i, h in enumerate(heights) if h > 1])
+        to_stack = rng.choice([i for i in range(stack_count) if i != from_stack])
+        count = rng.randint(1, heights[from_stack] - 1)
+
+        heights[from_stack] -= count
+        heights[to_stack] += count
+        procedure.append(f'move {count} from {from_stack + 1} to {to_stack + 1}')
+
+    return '\n'.join(diagram) + '\n\n' + '\n'.join(procedure)
+
+
+@generator(6)
+def generate_day_06(length: int, rng: random.Random) -> str:
+    # Three letters can never form a marker, so the markers are only found at the end
+    filler = ''.join(rng.choices('abc', k=length))
+    return filler + 'defghijklmnopq'
+
+
+@generator(7)
+def generate_day_07(entries: int, rng: random.Random) -> str:
+    root: dict = {}
+    directories = [root]
+
+    for index in range(entries):
+        parent = rng.choice(directories)
+
+        if rng.random() < 0.3:
+            directory: dict = {}
+            parent[f'd{index}'] = directory
+            directories.append(directory)
+        else:
+            parent[f'f{index}.txt'] = rng.randint(1000, 300000)
+
+    lines = ['$ cd /']
+    add_day_07_listing(root, lines)
+    return '\n'.join(lines)
+
+
+def add_day_07_listing(directory: dict, lines: list[str]):
+    lines.append('$ ls')
+
+    for name, item in directory.items():
+        lines.append(f'dir {name}' if isinstance(item, dict) else f'{item} {name}')
+
+    for name, item in directory.items():
+        if isinstance(item, dict):
+            lines.append(f'$ cd {name}')
+            add_day_07_listing(item, lines)
+            lines.append('$ cd ..')
+
+
+@generator(8)
+def generate_day_08(side: int, rng: random.Random) -> str:
+    return '\n'.join(''.join(rng.choices(string.digits, k=side)) for _ in range(side))
+
+
+@generator(9)
+def generate_day_09(motions: int, rng: random.Random) -> str:
+    return '\n'.join(f'{rng.choice("UDLR")} {rng.randint(1, 20)}' for _ in range(motions))
+
+
+@generator(10)
+def generate_day_10(instructions: int, rng: random.Random) -> str:
+    # The CRT only needs 240 cycles so shorter programs are padded out
+    lines: list[str] = []
+
+    for _ in range(max(instructions, 240)):
+        if rng.random() < 0.3:
+            lines.append('noop')
+        else:
+            lines.append(f'addx {rng.randint(-10, 10) or 1}')
+
+    return '\n'.join(lines)
+
+
+@generator(12)
+def generate_day_12(side: int, rng: random.Random) -> str:
+    height = max(side, 3)
+    width = max(side * 3, 26)
+    road = height // 2
+
+    rows: list[str] = []
+
+    for y in range(height):
+        row = ''
+
+        for x in range(width):
+            base = x * 26 // width
+
+            # The middle row climbs one step at a time so there is always a route
+            if y == road:
+                level = base
+            else:
+                level = max(0, base - rng.randint(0, 3))
+
+            row += chr(ord('a') + level)
+
+        rows.append(row)
+
+    rows[road] = 'S' + rows[road][1:-1] + 'E'
+    return '\n'.join(rows)
+
+
+@generator(13)
+def generate_day_13(pairs: int, rng: random.Random) -> str:
+    return '\n\n'.join(
+        f'{format_day_13_packet(generate_day_13_packet(rng, 0))}\n{format_day_13_packet(generate_day_13_packet(rng, 0))}'
+        for _ in range(pairs)
+    )
+
+
+def generate_day_13_packet(rng: random.Random, depth: int) -> list:
+    packet: list = []
+
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            packet.append(generate_day_13_packet(rng, depth + 1))
+        else:
+            packet.append(rng.randint(0, 10))
+
+    return packet
+
+
+def format_day_13_packet(packet: list) -> str:
+    return str(packet).replace(' ', '')
+
+
+@generator(14)
+def generate_day_14(depth: int, rng: random.Random) -> str:
+    lines: list[str] = []
+
+    for _ in range(max(1, depth // 4)):
+        x = rng.randint(500 - depth, 500 + depth)
+        y = rng.randint(2, depth + 2)
+        points = [(x, y)]
+
+        for segment in range(rng.randint(1, 4)):
+            if segment % 2 == 0:
+                x += rng.choice([-1, 1]) * rng.randint(1, 10)
+            else:
+                y = max(2, y + rng.choice([-1, 1]) * rng.randint(1, 10))
+            points.append((x, y))
+
+        lines.append(' -> '.join(f'{px},{py}' for px, py in points))
+
+    # A ledge under the source so part 1 has somewhere for the sand to settle
+    lines.append(f'{500 - depth // 2},{depth + 2} -> {500 + depth // 2},{depth + 2}')
+
+    return '\n'.join(lines)
+
+
+@generator(15)
+def generate_day_15(sensors: int, rng: random.Random) -> str:
+    # Random sensors leave more than one gap so part 2 reports the first it finds
+    lines: list[str] = []
+
+    for _ in range(sensors):
+        sx, sy = rng.randint(0, 4000000), rng.randint(0, 4000000)
+        bx = sx + rng.randint(-800000, 800000)
+        by = sy + rng.randint(-800000, 800000)
+        lines.append(f'Sensor at x={sx}, y={sy}: closest beacon is at x={bx}, y={by}')
+
+    return '\n'.join(lines)
+
+
+@generator(16)
+def generate_day_16(valves: int, rng: random.Random) -> str:
+    valves = max(2, min(valves, 26 * 26))
+    names = ['AA'] + rng.sample([a + b for a in string.ascii_uppercase for b in string.ascii_uppercase if a + b != 'AA'], valves - 1)
+    tunnels: dict[str, set[str]] = {name: set() for name in names}
+
+    # A random spanning tree keeps every valve reachable, plus a few shortcuts
+    for index in range(1, valves):
+        other = names[rng.randrange(index)]
+        tunnels[names[index]].add(other)
+        tunnels[other].add(names[index])
+
+    for _ in range(valves // 4):
+        a, b = rng.sample(names, 2)
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+
+    working = set(rng.sample(names[1:], min(valves - 1, max(1, valves // 4), 15)))
+
+    lines: list[str] = []
+
+    for name in names:
+        flow_rate = rng.randint(1, 25) if name in working else 0
+        others = sorted(tunnels[name])
+
+        if len(others) == 1:
+            lines.append(f'Valve {name} has flow rate={flow_rate}; tunnel leads to valve {others[0]}')
+        else:
+            lines.append(f'Valve {name} has flow rate={flow_rate}; tunnels lead to valves {", ".join(others)}')
+
+    return '\n'.join(lines)
+
+
+@generator(17)
+def generate_day_17(jets: int, rng: random.Random) -> str:
+    return ''.join(rng.choices('<>', k=jets))
+
+
+@generator(18)
+def generate_day_18(side: int, rng: random.Random) -> str:
+    centre = side / 2
+    lines: list[str] = []
+
+    for x in range(side):
+        for y in range(side):
+            for z in range(side):
+                inside = (x - centre) ** 2 + (y - centre) ** 2 + (z - centre) ** 2 <= centre ** 2
+                if inside and rng.random() < 0.6:
+                    lines.append(f'{x},{y},{z}')
+
+    return '\n'.join(lines)
+
+
+@generator(19)
+def generate_day_19(blueprints: int, rng: random.Random) -> str:
+    return '\n'.join(
+        f'Blueprint {i + 1}: '
+        f'Each ore robot costs {rng.randint(2, 4)} ore. '
+        f'Each clay robot costs {rng.randint(2, 4)} ore. '
+        f'Each obsidian robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} clay. '
+        f'Each geode robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} obsidian.'
+        for i in range(blueprints)
+    )
+
+
+@generator(20)
+def generate_day_20(numbers: int, rng: random.Random) -> str:
+    values = [rng.choice([-1, 1]) * rng.randint(1, 10000) for _ in range(max(numbers, 2) - 1)]
+    values.insert(rng.randrange(len(values) + 1), 0)
+    return '\n'.join(map(str, values))
+
+
+@generator(21)
+def generate_day_21(monkeys: int, rng: random.Random) -> str:
+    leaves = max(2, (monkeys + 1) // 2)
+    names: set[str] = {'root', 'humn'}
+    lines: list[str] = []
+
+    def new_name() -> str:
+        while True:
+            name = ''.join(rng.choices(string.ascii_lowercase, k=4))
+            if name not in names:
+                names.add(name)
+                return name
+
+    human_leaf = rng.randrange(leaves)
+
+    # Build top down from each monkey's value so every division is exact
+    def build(name: str, value: int, first_leaf: int, leaf_count: int):
+        if leaf_count == 1:
+            lines.append(f'{"humn" if first_leaf == human_leaf else name}: {value}')
+            return
+
+        left_count = rng.randint(1, leaf_count - 1)
+        left_name = 'humn' if left_count == 1 and first_leaf == human_leaf else new_name()
+        right_name = 'humn' if leaf_count - left_count == 1 and first_leaf + left_count == human_leaf else new_name()
+
+        # Keep every value positive and never divide by the human's side
+        operation = rng.choice('+-*/')
+        divisors = [d for d in range(2, 6) if value % d == 0]
+        human_on_right = first_leaf + left_count <= human_leaf < first_leaf + leaf_count
+
+        if operation == '*' and divisors:
+            right = rng.choice(divisors)
+            left = value // right
+        elif operation == '/' and not human_on_right:
+            right = rng.randint(2, 5)
+            left = value * right
+        elif operation == '-':
+            right = rng.randint(1, 100)
+            left = value + right
+        elif value >= 2:
+            operation = '+'
+            left = rng.randint(1, value - 1)
+            right = value - left
+        else:
+            operation = '-'
+            right = rng.randint(1, 100)
+            left = value + right
+
+        lines.append(f'{name}: {left_name} {operation} {right_name}')
+        build(left_name, left, first_leaf, left_count)
+        build(right_name, right, first_leaf + left_count, leaf_count - left_count)
+
+    build('root', rng.randint(1000, 100000), 0, leaves)
+    rng.shuffle(lines)
+    return '\n'.join(lines)
+
+
+@generator(22)
+def generate_day_22(instructions: int, rng: random.Random) -> str:
+    # Part 2 expects 50x50 faces in the same net as the real puzzle input
+    face_size = 50
+    face_rows = [(1, 2), (1, 1), (0, 1), (0, 0)]
+
+    lines: list[str] = []
+
+    for face_row, (first_face, last_face) in enumerate(face_rows):
+        for y in range(face_size):
+            row = ' ' * (first_face * face_size)
+            for x in range((last_face - first_face + 1) * face_size):
+                is_start = face_row == 0 and y == 0 and x == 0
+                row += '#' if not is_start and rng.random() < 0.1 else '.'
+            lines.append(row)
+
+    assert len(lines) == len(face_rows) * face_size
+
+    path = ''.join(f'{rng.randint(1, 50)}{rng.choice("LR")}' for _ in range(max(instructions, 1) - 1))
+    path += str(rng.randint(1, 50))
+
+    return '\n'.join(lines) + '\n\n' + path
+
+
+@generator(23)
+def generate_day_23(side: int, rng: random.Random) -> str:
+    return '\n'.join(''.join('#' if rng.random() < 0.5 else '.' for _ in range(side)) for _ in range(side))
+
+
+@generator(24)
+def generate_day_24(side: int, rng: random.Random) -> str:
+    width = max(side * 4, 3)
+    height = max(side, 3)
+
+    rows = ['#.' + '#' * width]
+
+    for _ in range(height):
+        rows.append('#' + ''.join(rng.choice('<>^v') if rng.random() < 0.35 else '.' for _ in range(width)) + '#')
+
+    rows.append('#' * width + '.#')
+    return '\n'.join(rows)
+
+
+@generator(25)
+def generate_day_25(numbers: int, rng: random.Random) -> str:
+    return '\n'.join(decimal_to_snafu(rng.randint(1, 10 ** 12)) for _ in range(numbers))
+
+
+def decimal_to_snafu(decimal: int) -> str:
+    snafu = ''
+
+    while decimal:
+        digit = (decimal + 2) % 5 - 2
+        snafu = '=-012'[digit + 2] + snafu
+        decimal = (decimal - digit) // 5
+
+    return snafu
+
+
+if __name__ == '__main__':
+    main()